@@ -0,0 +1,104 @@
+"""
+Compare the JSON codecs toppy can use on payloads shaped like the ones Top.gg sends.
+
+Run with ``python -m benchmarks.json_codecs`` from the root of the repository so toppy can be imported.
+Codecs that aren't installed are skipped.
+"""
+import importlib.util
+import random
+import string
+import timeit
+
+from toppy.utils import set_json_codec
+
+
+random.seed(0)
+
+
+def snowflake() -> str:
+    return str(random.randint(10 ** 17, 10 ** 19))
+
+
+def word(length: int) -> str:
+    return ''.join(random.choices(string.ascii_letters, k=length))
+
+
+def bot() -> dict:
+    return {
+        'defAvatar': '6debd47ed13483642cf09e832ed0bc1b',
+        'invite': f'https://discord.com/oauth2/authorize?client_id={snowflake()}&scope=bot',
+        'website': f'https://{word(10)}.com',
+        'support': word(8),
+        'github': f'https://github.com/{word(8)}/{word(8)}',
+        'longdesc': ' '.join(word(random.randint(2, 12)) for _ in range(300)),
+        'shortdesc': ' '.join(word(random.randint(2, 12)) for _ in range(15)),
+        'prefix': '!',
+        'lib': 'discord.py',
+        'clientid': snowflake(),
+        'avatar': word(32),
+        'id': snowflake(),
+        'discriminator': '0000',
+        'username': word(10),
+        'date': '2021-09-13T20:26:51.543Z',
+        'server_count': random.randint(0, 100000),
+        'shard_count': random.randint(1, 100),
+        'guilds': [snowflake() for _ in range(5)],
+        'shards': [],
+        'monthlyPoints': random.randint(0, 10000),
+        'points': random.randint(0, 100000),
+        'certifiedBot': False,
+        'owners': [snowflake() for _ in range(2)],
+        'tags': ['Music', 'Fun', 'Moderation'],
+        'donatebotguildid': ''
+    }
+
+
+PAYLOADS = {
+    'webhook vote': {
+        'bot': snowflake(),
+        'user': snowflake(),
+        'type': 'upvote',
+        'isWeekend': False,
+        'query': '?a=1&b=2'
+    },
+    'last 1000 votes': [
+        {'username': word(10), 'id': snowflake(), 'avatar': f'https://cdn.discordapp.com/avatars/{word(32)}.png'}
+        for _ in range(1000)
+    ],
+    'search page (100 bots)': {
+        'results': [bot() for _ in range(100)],
+        'limit': 100,
+        'offset': 0,
+        'count': 100,
+        'total': 50000
+    }
+}
+
+
+def main() -> None:
+    codecs = [name for name in ('json', 'ujson', 'msgspec', 'orjson') if importlib.util.find_spec(name) is not None]
+    encoded = {name: set_json_codec('json').dumps(payload) for name, payload in PAYLOADS.items()}
+
+    print(f'{"payload":<24}{"codec":<10}{"loads (us)":>12}{"dumps (us)":>12}{"speedup":>10}')
+
+    for name, payload in PAYLOADS.items():
+        baseline = None
+        number = max(10, 20000 // len(encoded[name]) * 10)
+
+        for codec_name in codecs:
+            codec = set_json_codec(codec_name)
+            text = encoded[name]
+
+            loads = min(timeit.repeat(lambda: codec.loads(text), number=number, repeat=5)) / number * 1e6
+            dumps = min(timeit.repeat(lambda: codec.dumps(payload), number=number, repeat=5)) / number * 1e6
+
+            if baseline is None:
+                baseline = loads + dumps
+
+            print(f'{name:<24}{codec_name:<10}{loads:>12.1f}{dumps:>12.1f}{baseline / (loads + dumps):>9.1f}x')
+
+    set_json_codec()
+
+
+if __name__ == '__main__':
+    main()
@@ -18,6 +18,9 @@ extras_require = {
     'cache': [
         'aiosqlite',
         'aiofiles'
+    ],
+    'speed': [
+        'orjson'
     ]
 }
 
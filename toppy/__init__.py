@@ -10,6 +10,7 @@ An API wrapper made for discord.py or any forks for Discord Bot List, DiscordBot
 from .client import Client, DiscordBotListClient, DiscordBotsGGClient, TopGGClient
 from .errors import (
     BadRequest,
+    CircuitOpen,
     ClientNotReady,
     Forbidden,
     HTTPException,
@@ -20,7 +21,7 @@ from .errors import (
 )
 from .models import DiscordBotsGGBot, DiscordBotsGGOwner, TopGGBot, TopGGUser
 
-from . import abc, cog, http, utils
+from . import abc, cache, cog, http, metrics, ratelimits, streaming, utils, votes
 
 
 __all__ = (
@@ -31,6 +32,7 @@ __all__ = (
     'TopGGClient',
     # errors
     'BadRequest',
+    'CircuitOpen',
     'ClientNotReady',
     'Forbidden',
     'HTTPException',
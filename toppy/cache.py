@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+from .errors import MissingExtraRequire
+from .utils import from_json, to_json
+
+try:
+    import aiosqlite
+except ImportError:
+    aiosqlite = None
+
+
+__all__ = (
+    'ResponseCache',
+    'SQLiteResponseCache'
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    expires: float
+    stale_until: float
+    # validators for conditional requests
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() >= self.expires
+
+
+class ResponseCache:
+    """
+    An in memory cache for the responses of read endpoints.
+    The least recently used responses are evicted once the cache is full.
+
+    Expired responses sent with an ``ETag`` or ``Last-Modified`` header are kept
+    and revalidated with a conditional request.
+
+    Pass an instance as ``cache`` to any client to use it.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    ttls: Optional[dict[:class:`str`, Optional[:class:`float`]]]
+        The amount of seconds to cache each route template for, such as ``{'/bots/{bot_id}': 60}``.
+        This overrides the defaults of each site. Set a route to ``None`` to stop caching it.
+    maxsize: :class:`int`
+        The maximum amount of responses to keep.
+        Defaults to 1024.
+    stale_while_revalidate: :class:`float`
+        The amount of seconds after a response expires it can still be returned
+        while it is refreshed in the background.
+        Defaults to 0.
+
+    Attributes
+    -----------
+    hits: :class:`int`
+        The amount of times a fresh response was returned.
+    stale_hits: :class:`int`
+        The amount of times an expired response was returned while it was being refreshed.
+    misses: :class:`int`
+        The amount of times a request had to be made.
+    coalesced: :class:`int`
+        The amount of times a lookup missed but joined a request that was already being made.
+    """
+    def __init__(self, ttls: Optional[dict[str, Optional[float]]] = None, *, maxsize: int = 1024,
+                 stale_while_revalidate: float = 0):
+        self.ttls: dict[str, Optional[float]] = ttls or {}
+        self.maxsize = maxsize
+        self.stale_while_revalidate = stale_while_revalidate
+
+        self.hits: int = 0
+        self.stale_hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+
+        self._entries: OrderedDict[Any, CacheEntry] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} size={len(self)} maxsize={self.maxsize} hits={self.hits} '
+            f'stale_hits={self.stale_hits} misses={self.misses} coalesced={self.coalesced}>'
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        The fraction of lookups that didn't make a request.
+
+        Returns
+        --------
+        :class:`float`
+        """
+        saved = self.hits + self.stale_hits + self.coalesced
+        total = saved + self.misses
+        return saved / total if total else 0.0
+
+    def get_ttl(self, path: str, default: Optional[float] = None) -> Optional[float]:
+        """
+        Get the amount of seconds to cache a route template for.
+
+        Parameters
+        -----------
+        path: :class:`str`
+            The route template.
+        default: Optional[:class:`float`]
+            The default of the site for the route.
+
+        Returns
+        --------
+        Optional[:class:`float`]
+            ``None`` if the route shouldn't be cached.
+        """
+        return self.ttls.get(path, default)
+
+    def get(self, key: Any) -> Optional[CacheEntry]:
+        """
+        Get a cached response. Expired responses past the stale period aren't returned.
+
+        Hits are counted here. A lookup that returns ``None`` is counted by the client as a miss or as
+        coalesced once it knows whether a request was made for it.
+
+        Parameters
+        -----------
+        key: Any
+            The key of the request.
+
+        Returns
+        --------
+        Optional[CacheEntry]
+        """
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            return None
+
+        now = time.monotonic()
+
+        if now >= entry.stale_until:
+            if entry.etag is None and entry.last_modified is None:
+                self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+
+        if now >= entry.expires:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def peek(self, key: Any) -> Optional[CacheEntry]:
+        """
+        Get a cached response even if it has expired without counting it as a lookup.
+
+        Parameters
+        -----------
+        key: Any
+            The key of the request.
+
+        Returns
+        --------
+        Optional[CacheEntry]
+        """
+        return self._entries.get(key)
+
+    def set(self, key: Any, value: Any, ttl: float, *, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Cache a response.
+
+        Parameters
+        -----------
+        key: Any
+            The key of the request.
+        value: Any
+            The decoded response.
+        ttl: :class:`float`
+            The amount of seconds the response is fresh for.
+        etag: Optional[:class:`str`]
+            The ``ETag`` header of the response.
+        last_modified: Optional[:class:`str`]
+            The ``Last-Modified`` header of the response.
+        """
+        expires = time.monotonic() + ttl
+        self._store(key, CacheEntry(value, expires, expires + self.stale_while_revalidate, etag, last_modified))
+
+    def _store(self, key: Any, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            evicted = next(iter(self._entries))
+            _log.debug('Evicted %s from the response cache.', evicted)
+            self._remove(evicted)
+
+    def _remove(self, key: Any) -> None:
+        del self._entries[key]
+
+    def invalidate(self, key: Any = None) -> None:
+        """
+        Remove a response from the cache or clear the whole cache.
+
+        Parameters
+        -----------
+        key: Any
+            The key of the request. If not passed the whole cache is cleared.
+        """
+        if key is None:
+            for key in list(self._entries):
+                self._remove(key)
+        elif key in self._entries:
+            self._remove(key)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    A :class:`ResponseCache` that also stores responses in a SQLite file so they survive a restart.
+    Use :meth:`connect` to load the stored responses before starting the bot.
+
+    Changes are written in batches in the background. This requires the ``cache`` extra.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The path to the database file.
+        Defaults to ``toppy_response_cache.db``.
+    **kwargs:
+        The keyword arguments for :class:`ResponseCache`.
+    """
+    def __init__(self, path: str = 'toppy_response_cache.db', **kwargs: Any):
+        super().__init__(**kwargs)
+        self.path = path
+
+        self.conn: Optional[aiosqlite.Connection] = None
+        # key -> entry to write or None to delete
+        self._pending: dict[str, Optional[CacheEntry]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    async def connect(self) -> None:
+        """
+        Connect to the database and load the stored responses.
+        """
+        if aiosqlite is None:
+            raise MissingExtraRequire('cache')
+
+        self.conn = await aiosqlite.connect(self.path)
+        self._flush_lock = asyncio.Lock()
+        await self.conn.execute(
+            '''CREATE TABLE IF NOT EXISTS responses(
+                        key TEXT PRIMARY KEY,
+                        value TEXT,
+                        expires REAL,
+                        stale_until REAL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        accessed REAL
+            );'''
+        )
+        await self.conn.commit()
+
+        # expiry times are stored as unix timestamps since the monotonic clock resets on reboot
+        offset = time.monotonic() - time.time()
+
+        async with self.conn.execute(
+            '''SELECT key, value, expires, stale_until, etag, last_modified FROM responses ORDER BY accessed;'''
+        ) as cursor:
+            async for key, value, expires, stale_until, etag, last_modified in cursor:
+                entry = CacheEntry(from_json(value), expires + offset, stale_until + offset, etag, last_modified)
+                # not self._store so loaded responses aren't written back
+                ResponseCache._store(self, _load_key(key), entry)
+
+        _log.info('Loaded %d responses from %s', len(self), self.path)
+
+    async def close(self) -> None:
+        """
+        Write the pending changes and close the connection to the database.
+        """
+        # the task is only set while it is sleeping so no writes are lost by cancelling it
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        if self.conn is not None:
+            # waits for a flush that already started
+            await self.flush()
+            await self.conn.close()
+            self.conn = None
+
+    def _store(self, key: Any, entry: CacheEntry) -> None:
+        super()._store(key, entry)
+        self._mark(key, entry)
+
+    def _remove(self, key: Any) -> None:
+        super()._remove(key)
+        self._mark(key, None)
+
+    def _mark(self, key: Any, entry: Optional[CacheEntry]) -> None:
+        if self.conn is None:
+            return
+
+        self._pending[_dump_key(key)] = entry
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(1)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Write the pending changes to the database.
+        """
+        if self.conn is None or self._flush_lock is None:
+            return
+
+        async with self._flush_lock:
+            if self.conn is not None and self._pending:
+                await self._write()
+
+    async def _write(self) -> None:
+        assert self.conn is not None
+        pending, self._pending = self._pending, {}
+        offset = time.time() - time.monotonic()
+        now = time.time()
+
+        await self.conn.executemany(
+            '''DELETE FROM responses WHERE key = ?;''',
+            [(key,) for key, entry in pending.items() if entry is None]
+        )
+        await self.conn.executemany(
+            '''INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?);''',
+            [
+                (
+                    key,
+                    to_json(entry.value),
+                    entry.expires + offset,
+                    entry.stale_until + offset,
+                    entry.etag,
+                    entry.last_modified,
+                    now
+                )
+                for key, entry in pending.items() if entry is not None
+            ]
+        )
+        await self.conn.commit()
+
+        _log.debug('Wrote %d changes to %s', len(pending), self.path)
+
+
+def _dump_key(key: Any) -> str:
+    # always the standard library so stored keys match whichever codec is set
+    return json.dumps(key)
+
+
+def _load_key(key: str) -> Any:
+    # JSON arrays come back as lists but keys must be hashable
+    def to_tuple(obj: Any) -> Any:
+        return tuple(to_tuple(item) for item in obj) if isinstance(obj, list) else obj
+
+    return to_tuple(json.loads(key))
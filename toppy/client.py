@@ -1,19 +1,49 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
 import functools
+import logging
+import time
 from abc import abstractmethod
-from typing import TYPE_CHECKING, AsyncGenerator, ClassVar, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Type
+)
 
 import aiohttp
 
+from .cache import ResponseCache
 from .errors import ClientNotReady, HTTPException
-from .http import BaseHTTPClient, DiscordBotListHTTPClient, DiscordBotsGGHTTPClient, TopGGHTTPClient
+from .http import (
+    BaseHTTPClient,
+    CircuitBreaker,
+    ConnectionPoolStats,
+    DiscordBotListHTTPClient,
+    DiscordBotsGGHTTPClient,
+    RetryPolicy,
+    Route,
+    TopGGHTTPClient,
+    create_session
+)
+from .metrics import MetricsHook
 from .models import DiscordBotsGGBot, TopGGBot, TopGGUser
+from .ratelimits import AbstractRateLimitBackend
 from .utils import copy_doc, MISSING
+from .votes import VoteSnapshot
 
 if TYPE_CHECKING:
     from .abc import ClientProtocol
+    from .webhook import AbstractDatabase
 
 
 __all__ = (
@@ -24,6 +54,78 @@ __all__ = (
 )
 
 
+_log = logging.getLogger(__name__)
+
+
+class BotStats(NamedTuple):
+    guilds: int
+    users: int
+    voice_connections: int
+    shard_count: int
+
+    @classmethod
+    def collect(cls, client: ClientProtocol) -> BotStats:
+        return cls(
+            guilds=len(client.guilds or []),
+            users=len(client.users or []),
+            voice_connections=len(client.voice_clients),
+            shard_count=client.shard_count or 1
+        )
+
+
+async def _paginate(fetch_page: Callable[[int], Awaitable[list[dict[str, Any]]]], per_page: int,
+                    limit: Optional[int] = None) -> AsyncGenerator[dict[str, Any], None]:
+    # the next page is requested while the current one is being used
+    # only one page is fetched ahead so the rate limits are still followed
+    page = 0
+    task: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(page))
+    count = 0
+
+    try:
+        while task is not None:
+            results = await task
+            task = None
+
+            if len(results) >= per_page and (limit is None or count + len(results) < limit):
+                page += 1
+                task = asyncio.ensure_future(fetch_page(page))
+
+            for result in results:
+                if limit is not None and count >= limit:
+                    return
+                count += 1
+                yield result
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+async def _paginate_stream(stream_page: Callable[[int], AsyncGenerator[dict[str, Any], None]], per_page: int,
+                           limit: Optional[int] = None) -> AsyncGenerator[dict[str, Any], None]:
+    # each page is decoded as it is received so only one result is in memory at a time
+    page = 0
+    count = 0
+
+    while limit is None or count < limit:
+        results = stream_page(page)
+        received = 0
+
+        try:
+            async for result in results:
+                if limit is not None and count >= limit:
+                    return
+                received += 1
+                count += 1
+                yield result
+        finally:
+            # stop reading the response if the loop ended early
+            await results.aclose()
+
+        if received < per_page:
+            return
+        page += 1
+
+
 class BaseClient:
     http_class: Type[BaseHTTPClient]
     shortened: str
@@ -35,16 +137,40 @@ class BaseClient:
             *,
             interval: Optional[float] = None,
             start_on_ready: bool = True,
-            session: Optional[aiohttp.ClientSession] = None
+            session: Optional[aiohttp.ClientSession] = None,
+            rate_limit_backend: Optional[AbstractRateLimitBackend] = None,
+            cache: Optional[ResponseCache] = None,
+            skip_unchanged: bool = False,
+            min_delta: int = 0,
+            max_staleness: Optional[float] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            circuit_breaker: Optional[CircuitBreaker] = None,
+            keep_raw: bool = True,
+            metrics: Optional[MetricsHook] = None,
+            log_bodies: bool = False
     ) -> None:
         self.interval: float = interval or 600
 
+        self.skip_unchanged: bool = skip_unchanged
+        self.min_delta: int = min_delta
+        self.max_staleness: Optional[float] = max_staleness
+        self._last_posted: Optional[dict[str, int]] = None
+        self._last_posted_at: float = 0
+
         self.start_on_ready: bool = start_on_ready
 
         self.client = client
         self.http: BaseHTTPClient = MISSING
         self.token = token
-        self.__session: Optional[aiohttp.ClientSession] = session
+        self._session: Optional[aiohttp.ClientSession] = session
+        self.rate_limit_backend: Optional[AbstractRateLimitBackend] = rate_limit_backend
+        self.cache: Optional[ResponseCache] = cache
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.keep_raw: bool = keep_raw
+        self.metrics: Optional[MetricsHook] = metrics
+        self.log_bodies: bool = log_bodies
+        self._failures: int = 0
 
         self.__task: asyncio.Task = MISSING
         self._merge()
@@ -65,7 +191,16 @@ class BaseClient:
         async def start(*args, **kwargs) -> None:
             task = self.client.loop.create_task(old_start(*args, **kwargs))
 
-            self.http = self.http_class(self.token, session=self.__session)
+            self.http = self.http_class(
+                self.token,
+                session=self._session,
+                rate_limit_backend=self.rate_limit_backend,
+                cache=self.cache,
+                retry_policy=self.retry_policy,
+                circuit_breaker=self.circuit_breaker,
+                metrics=self.metrics,
+                log_bodies=self.log_bodies
+            )
             if self.start_on_ready:
                 self.start()
 
@@ -99,24 +234,60 @@ class BaseClient:
         """Cancels the task of auto posting stats."""
         self.task.cancel()
 
-    async def _post_stats_handler(self, bot_id: int, **kwargs) -> None:
+    async def _post_stats_handler(self, bot_id: int, **kwargs) -> Optional[HTTPException]:
         try:
             await self.http.post_stats(bot_id, **kwargs)
         except HTTPException as exc:
             self.client.dispatch(f'{self.shortened}_post_error', exc)
+            return exc
         else:
+            self._last_posted = kwargs
+            self._last_posted_at = time.monotonic()
             self.client.dispatch(f'{self.shortened}_post_success')
+            return None
+
+    def _should_post(self, stats: dict[str, int]) -> bool:
+        if not self.skip_unchanged or self._last_posted is None:
+            return True
+        if self.max_staleness is not None and time.monotonic() - self._last_posted_at >= self.max_staleness:
+            return True
+        if stats.keys() != self._last_posted.keys():
+            return True
+
+        return any(abs(value - self._last_posted[key]) > self.min_delta for key, value in stats.items())
+
+    async def _autopost(self, stats: BotStats) -> Optional[float]:
+        # returns how soon to try again if posting failed in a way that can go away by itself
+        kwargs = self._format_stats(stats)
+
+        if not self._should_post(kwargs):
+            _log.debug('Skipping %s autopost since the stats have not changed enough.', self.shortened)
+            return None
+
+        error = await self._post_stats_handler(self._get_bot_id(), **kwargs)
+        policy = self.http.retry_policy
+
+        if error is None or not policy.is_retryable(error):
+            self._failures = 0
+            return None
+
+        self._failures += 1
+        delay = max(policy.backoff(self._failures), getattr(error, 'retry_after', None) or 0)
+        return min(delay, self.interval)
 
     async def _post_task(self) -> None:
         await self.client.wait_until_ready()
         while not self.client.is_closed():
-            await self.post_stats()
-            await asyncio.sleep(self.interval)
+            retry_after = await self._autopost(BotStats.collect(self.client))
+            await asyncio.sleep(self.interval if retry_after is None else retry_after)
 
     @abstractmethod
-    async def post_stats(self) -> None:
+    def _format_stats(self, stats: BotStats) -> dict[str, int]:
         raise NotImplementedError
 
+    async def post_stats(self) -> None:
+        await self._post_stats_handler(self._get_bot_id(), **self._format_stats(BotStats.collect(self.client)))
+
 
 class DiscordBotListClient(BaseClient):
     """A Client to access the Discord Bot List API. This includes auto-posting Discord Bot Stats.
@@ -138,6 +309,32 @@ class DiscordBotListClient(BaseClient):
         Defaults to True.
     session: Optional[:class:`aiohttp.ClientSession`]
         The session for the HTTP Client.
+    rate_limit_backend: Optional[:class:`toppy.ratelimits.AbstractRateLimitBackend`]
+        Where rate limit buckets are stored. Use :class:`toppy.ratelimits.SQLiteRateLimitBackend`
+        to share them between processes. Defaults to storing them in memory.
+    cache: Optional[:class:`toppy.cache.ResponseCache`]
+        A cache for the responses of read endpoints. Responses aren't cached by default.
+    skip_unchanged: :class:`bool`
+        Whether autopost should skip posting stats that haven't changed since the last successful post.
+        Defaults to False.
+    min_delta: :class:`int`
+        With ``skip_unchanged``, how much a stat has to change by before it's posted again.
+        Defaults to 0.
+    max_staleness: Optional[:class:`float`]
+        With ``skip_unchanged``, the maximum amount of seconds to go without posting even if nothing changed.
+        Defaults to never.
+    retry_policy: Optional[:class:`toppy.http.RetryPolicy`]
+        How failed requests are retried. Autopost also uses it to try again sooner after a temporary failure.
+    circuit_breaker: Optional[:class:`toppy.http.CircuitBreaker`]
+        Makes requests fail fast with :exc:`toppy.CircuitOpen` while the site is down.
+    keep_raw: :class:`bool`
+        Whether models keep the data they were made from as ``raw``. Disable to save memory.
+        Defaults to True.
+    metrics: Optional[:class:`toppy.metrics.MetricsHook`]
+        Receives the latency, status, retries, rate limit waits and bytes of every request.
+    log_bodies: :class:`bool`
+        Whether to log the body of every response at the debug level.
+        Defaults to False.
 
 
     .. versionchanged:: 1.4
@@ -162,16 +359,15 @@ class DiscordBotListClient(BaseClient):
         or `dbl_post_success` with no arguments.
         """
 
-        bot_id = self._get_bot_id()
+        await super().post_stats()
 
-        kwargs = {
-            'voice_connections': len(self.client.voice_clients),
-            'users': len(self.client.users or []),
-            'guilds': len(self.client.guilds or [])
+    def _format_stats(self, stats: BotStats) -> dict[str, int]:
+        return {
+            'voice_connections': stats.voice_connections,
+            'users': stats.users,
+            'guilds': stats.guilds
         }
 
-        await self._post_stats_handler(bot_id, **kwargs)
-
 
 class DiscordBotsGGClient(BaseClient):
     """A Client to access the DiscordBotsGG. This includes auto-posting Discord Bot Stats.
@@ -193,6 +389,32 @@ class DiscordBotsGGClient(BaseClient):
         Defaults to True.
     session: Optional[:class:`aiohttp.ClientSession`]
         The session for the HTTP Client.
+    rate_limit_backend: Optional[:class:`toppy.ratelimits.AbstractRateLimitBackend`]
+        Where rate limit buckets are stored. Use :class:`toppy.ratelimits.SQLiteRateLimitBackend`
+        to share them between processes. Defaults to storing them in memory.
+    cache: Optional[:class:`toppy.cache.ResponseCache`]
+        A cache for the responses of read endpoints. Responses aren't cached by default.
+    skip_unchanged: :class:`bool`
+        Whether autopost should skip posting stats that haven't changed since the last successful post.
+        Defaults to False.
+    min_delta: :class:`int`
+        With ``skip_unchanged``, how much a stat has to change by before it's posted again.
+        Defaults to 0.
+    max_staleness: Optional[:class:`float`]
+        With ``skip_unchanged``, the maximum amount of seconds to go without posting even if nothing changed.
+        Defaults to never.
+    retry_policy: Optional[:class:`toppy.http.RetryPolicy`]
+        How failed requests are retried. Autopost also uses it to try again sooner after a temporary failure.
+    circuit_breaker: Optional[:class:`toppy.http.CircuitBreaker`]
+        Makes requests fail fast with :exc:`toppy.CircuitOpen` while the site is down.
+    keep_raw: :class:`bool`
+        Whether models keep the data they were made from as ``raw``. Disable to save memory.
+        Defaults to True.
+    metrics: Optional[:class:`toppy.metrics.MetricsHook`]
+        Receives the latency, status, retries, rate limit waits and bytes of every request.
+    log_bodies: :class:`bool`
+        Whether to log the body of every response at the debug level.
+        Defaults to False.
 
 
     .. versionadded:: 2.0
@@ -222,7 +444,7 @@ class DiscordBotsGGClient(BaseClient):
         :class:`DiscordBotsGGBot`
         """
         data = await self.http.search_one_bot(bot_id)
-        return DiscordBotsGGBot(data)
+        return DiscordBotsGGBot(data, keep_raw=self.keep_raw)
 
     async def search_bots(self, *args, **kwargs) -> list[DiscordBotsGGBot]:
         """
@@ -256,7 +478,84 @@ class DiscordBotsGGClient(BaseClient):
         list[:class:`DiscordBotsGGBot`]
         """
         data = await self.http.search_bots(*args, **kwargs)
-        return [DiscordBotsGGBot(bot) for bot in data['bots']]
+        return [DiscordBotsGGBot(bot, keep_raw=self.keep_raw) for bot in data['bots']]
+
+    async def iter_bots(self, query: Optional[str] = None, *, per_page: int = 100, limit: Optional[int] = None,
+                        author_id: Optional[int] = None, author: Optional[str] = None,
+                        unverified: Optional[bool] = None, lib: Optional[str] = None,
+                        sort: Literal['username', 'id', 'guildcount', 'library', 'author'] = 'guildcount',
+                        order: Optional[Literal['ASC', 'DESC']] = None,
+                        stream: bool = False) -> AsyncGenerator[DiscordBotsGGBot, None]:
+        """
+        Search up bots on DiscordBotsGG going through every page.
+
+        The next page is requested while the current one is being iterated
+        and only one page is kept in memory.
+        With ``stream`` each bot is decoded as it is received instead.
+
+        .. versionadded:: 2.1
+
+        Parameters
+        -----------
+        query: Optional[:class:`str`]:
+            Searches for bots that contain the query in their username or short description.
+        per_page: :class:`int`:
+            The number of results to retrieve per request. Must be between 1 and 100.
+            Defaults to 100.
+        limit: Optional[:class:`int`]:
+            The maximum number of bots to yield.
+            Defaults to every bot found.
+        author_id: Optional[:class:`int`]:
+            Retrieves bots by the specified auther/co-owner's ID.
+        author: Optional[:class:`str`]:
+            Retrieves bots by the specified author/co-owner’s username and discriminator.
+        unverified: Optional[:class:`bool`]:
+            Retrieves unapproved bots.
+        lib: Optional[:class:`str`]:
+            Retrieves bots written in a specific library.
+        sort: Literal['username', 'id', 'guildcount', 'library', 'author']:
+            Sorts the results by any of the following keys: username, id, guildcount, library, author.
+        order: Optional[Literal['ASC', 'DESC']]:
+            Sorts the results in ASC or DESC order.
+        stream: :class:`bool`
+            Whether to decode each page while it is received. This uses less memory for large pages
+            but the next page isn't requested early.
+            Defaults to False.
+
+        Yields
+        -------
+        :class:`DiscordBotsGGBot`
+
+        Example
+        ----------
+        .. code:: py
+
+            async for bot in dbgg.iter_bots(lib='discord.py'):
+                ...
+        """
+        search = functools.partial(
+            self.http.stream_search_bots if stream else self.http.search_bots,
+            query,
+            limit=per_page,
+            author_id=author_id,
+            author=author,
+            unverified=unverified,
+            lib=lib,
+            sort=sort,
+            order=order
+        )
+
+        if stream:
+            results = _paginate_stream(lambda page: search(page=page), per_page, limit)
+        else:
+            async def fetch_page(page: int) -> list[dict[str, Any]]:
+                data = await search(page=page)
+                return data['bots']
+
+            results = _paginate(fetch_page, per_page, limit)
+
+        async for bot in results:
+            yield DiscordBotsGGBot(bot, keep_raw=self.keep_raw)
 
     async def post_stats(self) -> None:
         """Post your bots stats to DiscordBotsGG.
@@ -266,16 +565,16 @@ class DiscordBotsGGClient(BaseClient):
         or `dbgg_post_success` with no arguments.
         """
 
-        bot_id = self._get_bot_id()
+        await super().post_stats()
 
+    def _format_stats(self, stats: BotStats) -> dict[str, int]:
         kwargs = {
-            'guild_count': len(self.client.guilds or []),
+            'guild_count': stats.guilds
         }
 
         if self.post_shard_count:
-            kwargs['shard_count'] = self.client.shard_count or 1
-
-        await self._post_stats_handler(bot_id, **kwargs)
+            kwargs['shard_count'] = stats.shard_count
+        return kwargs
 
 
 class TopGGClient(BaseClient):
@@ -302,6 +601,32 @@ class TopGGClient(BaseClient):
         Defaults to True.
     session: Optional[:class:`aiohttp.ClientSession`]
         The session for the HTTP Client.
+    rate_limit_backend: Optional[:class:`toppy.ratelimits.AbstractRateLimitBackend`]
+        Where rate limit buckets are stored. Use :class:`toppy.ratelimits.SQLiteRateLimitBackend`
+        to share them between processes. Defaults to storing them in memory.
+    cache: Optional[:class:`toppy.cache.ResponseCache`]
+        A cache for the responses of read endpoints. Responses aren't cached by default.
+    skip_unchanged: :class:`bool`
+        Whether autopost should skip posting stats that haven't changed since the last successful post.
+        Defaults to False.
+    min_delta: :class:`int`
+        With ``skip_unchanged``, how much a stat has to change by before it's posted again.
+        Defaults to 0.
+    max_staleness: Optional[:class:`float`]
+        With ``skip_unchanged``, the maximum amount of seconds to go without posting even if nothing changed.
+        Defaults to never.
+    retry_policy: Optional[:class:`toppy.http.RetryPolicy`]
+        How failed requests are retried. Autopost also uses it to try again sooner after a temporary failure.
+    circuit_breaker: Optional[:class:`toppy.http.CircuitBreaker`]
+        Makes requests fail fast with :exc:`toppy.CircuitOpen` while the site is down.
+    keep_raw: :class:`bool`
+        Whether models keep the data they were made from as ``raw``. Disable to save memory.
+        Defaults to True.
+    metrics: Optional[:class:`toppy.metrics.MetricsHook`]
+        Receives the latency, status, retries, rate limit waits and bytes of every request.
+    log_bodies: :class:`bool`
+        Whether to log the body of every response at the debug level.
+        Defaults to False.
 
 
     .. versionchanged:: 1.4
@@ -342,7 +667,61 @@ class TopGGClient(BaseClient):
         list[:class:`TopGGBot`]
         """
         raw_bots = await self.http.search_bots(query, limit=limit, offset=offset)
-        return [TopGGBot(bot) for bot in raw_bots]
+        return [TopGGBot(bot, keep_raw=self.keep_raw) for bot in raw_bots]
+
+    async def iter_bots(self, query: str, *, per_page: int = 500, limit: Optional[int] = None,
+                        offset: int = 0, stream: bool = False) -> AsyncGenerator[TopGGBot, None]:
+        """Search up bots on Top.gg going through every page.
+
+        The next page is requested while the current one is being iterated
+        and only one page is kept in memory.
+        With ``stream`` each bot is decoded as it is received instead.
+
+        .. versionadded:: 2.1
+
+        Parameters
+        -----------
+        query: :class:`str`
+            The query to use when searching.
+        per_page: :class:`int`
+            The number of bots to retrieve per request. Must be between 1 and 500.
+            Defaults to 500. Keyword only.
+        limit: Optional[:class:`int`]
+            The maximum number of bots to yield.
+            Defaults to every bot found. Keyword only.
+        offset: :class:`int`
+            The amount of bots to skip in the results.
+            Keyword only.
+        stream: :class:`bool`
+            Whether to decode each page while it is received. This uses less memory for large pages
+            but the next page isn't requested early.
+            Defaults to False. Keyword only.
+
+        Yields
+        -------
+        :class:`TopGGBot`
+
+        Example
+        ----------
+        .. code:: py
+
+            async for bot in topgg.iter_bots('music'):
+                ...
+        """
+        if stream:
+            results = _paginate_stream(
+                lambda page: self.http.stream_search_bots(query, limit=per_page, offset=offset + page * per_page),
+                per_page,
+                limit
+            )
+        else:
+            async def fetch_page(page: int) -> list[dict[str, Any]]:
+                return await self.http.search_bots(query, limit=per_page, offset=offset + page * per_page)
+
+            results = _paginate(fetch_page, per_page, limit)
+
+        async for bot in results:
+            yield TopGGBot(bot, keep_raw=self.keep_raw)
 
     async def search_one_bot(self, bot_id: int, /) -> TopGGBot:
         """Search a single bot on Top.gg.
@@ -358,9 +737,9 @@ class TopGGClient(BaseClient):
         :class:`TopGGBot`
         """
         data = await self.http.search_one_bot(bot_id)
-        return TopGGBot(data)
+        return TopGGBot(data, keep_raw=self.keep_raw)
 
-    async def last_1000_votes(self, bot_id: int = None, /) -> AsyncGenerator[TopGGUser, None]:
+    async def last_1000_votes(self, bot_id: int = None, /, *, stream: bool = False) -> AsyncGenerator[TopGGUser, None]:
         """Get the last 1000 votes of a bot on Top.gg.
 
         Parameters
@@ -369,6 +748,12 @@ class TopGGClient(BaseClient):
             The ID of the bot.
             Defaults to the Bot initialized with.
             Positional only.
+        stream: :class:`bool`
+            Whether to yield each user as soon as it is received instead of after the whole response.
+            Streamed votes are never cached.
+            Defaults to False. Keyword only.
+
+            .. versionadded:: 2.1
 
         Yields
         -------
@@ -383,9 +768,55 @@ class TopGGClient(BaseClient):
         """
         bot_id = bot_id or self._get_bot_id()
 
+        if stream:
+            async for user in self.http.stream_last_1000_votes(bot_id):
+                yield TopGGUser(user, keep_raw=self.keep_raw)
+            return
+
         users = await self.http.last_1000_votes(bot_id)
         for user in users:
-            yield TopGGUser(user)
+            yield TopGGUser(user, keep_raw=self.keep_raw)
+
+    async def vote_snapshot(self, bot_id: int = None, /, *, stream: bool = False) -> VoteSnapshot:
+        """Get the last 1000 votes of a bot on Top.gg as a :class:`toppy.votes.VoteSnapshot`.
+
+        This is better than :meth:`last_1000_votes` for counting votes or voters
+        since no :class:`TopGGUser` is made.
+
+        .. versionadded:: 2.1
+
+        Parameters
+        ----------
+        bot_id: Optional[:class:`int`]
+            The ID of the bot.
+            Defaults to the Bot initialized with.
+            Positional only.
+        stream: :class:`bool`
+            Whether to add each vote to the snapshot as soon as it is received.
+            Streamed votes are never cached.
+            Defaults to False. Keyword only.
+
+        Returns
+        --------
+        :class:`toppy.votes.VoteSnapshot`
+
+        Example
+        ----------
+        .. code:: py
+
+            snapshot = await topgg.vote_snapshot()
+            for user_id, votes in snapshot.top_voters(10):
+                ...
+        """
+        bot_id = bot_id or self._get_bot_id()
+
+        if not stream:
+            return VoteSnapshot.from_data(await self.http.last_1000_votes(bot_id))
+
+        snapshot = VoteSnapshot()
+        async for user in self.http.stream_last_1000_votes(bot_id):
+            snapshot._append(user)
+        return snapshot
 
     async def check_if_voted(self, bot_id: Optional[int], user_id: int) -> bool:
         """Check if a user has voted on a bot.
@@ -406,6 +837,86 @@ class TopGGClient(BaseClient):
 
         return await self.http.user_vote(bot_id, user_id)
 
+    async def check_many_voted(self, user_ids: Iterable[int], /, bot_id: Optional[int] = None, *,
+                               db: Optional[AbstractDatabase] = None, use_recent_votes: bool = True,
+                               max_concurrency: Optional[int] = None) -> dict[int, bool]:
+        """Check if many users have voted on a bot in the last 12 hours.
+
+        Users are answered without a request where possible:
+
+        - Users with a Top.gg vote in ``db`` from the last 12 hours have voted. Test votes are ignored.
+        - If the bot has less than 1000 votes this month, users missing from
+          :meth:`last_1000_votes` haven't voted.
+
+        The rest are checked one by one like :meth:`check_if_voted` at the same time.
+
+        .. versionadded:: 2.1
+
+        Parameters
+        ----------
+        user_ids: Iterable[:class:`int`]
+            The IDs of the users.
+            Positional only.
+        bot_id: Optional[:class:`int`]
+            The ID of the bot.
+            Defaults to the Bot initialized with.
+        db: Optional[:class:`toppy.webhook.AbstractDatabase`]
+            The database of the webhook server to look up votes in.
+            Keyword only.
+        use_recent_votes: :class:`bool`
+            Whether to use :meth:`last_1000_votes` to find users who haven't voted.
+            Defaults to True. Keyword only.
+        max_concurrency: Optional[:class:`int`]
+            The maximum amount of checks to make at once.
+            Defaults to the size of the rate limit bucket. Keyword only.
+
+        Returns
+        --------
+        dict[:class:`int`, :class:`bool`]
+            The user IDs mapped to whether they have voted.
+        """
+        bot_id = bot_id or self._get_bot_id()
+
+        results: dict[int, bool] = {}
+        remaining = set(user_ids)
+
+        if db is not None and remaining:
+            since = datetime.datetime.now() - datetime.timedelta(hours=12)
+            for vote in await db.fetch_since(since, site='Top.gg'):
+                if vote.id in remaining and vote.type != 'test':
+                    results[vote.id] = True
+                    remaining.discard(vote.id)
+
+        if use_recent_votes and remaining:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+            # votes are reset at the start of the month so votes from the last month aren't in the list
+            if now - month_start >= datetime.timedelta(hours=12):
+                snapshot = await self.vote_snapshot(bot_id)
+
+                # when the list isn't full it has every vote from this month
+                if len(snapshot) < 1000:
+                    voters = snapshot.voters
+
+                    for user_id in remaining - voters:
+                        results[user_id] = False
+                    remaining &= voters
+
+        if remaining:
+            if max_concurrency is None:
+                limiter = self.http._route_limiter(Route('GET', '/bots/{bot_id}/check'))
+                max_concurrency = int(limiter.rate) if limiter else len(remaining)
+            semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+            async def check(user_id: int) -> None:
+                async with semaphore:
+                    results[user_id] = await self.http.user_vote(bot_id, user_id)  # type: ignore # bot_id is set
+
+            await asyncio.gather(*(check(user_id) for user_id in remaining))
+
+        return results
+
     async def post_stats(self) -> None:
         """Post your bots stats to Top.gg.
         All stats are automatically found and posted.
@@ -414,16 +925,16 @@ class TopGGClient(BaseClient):
         or `topgg_post_success` with no arguments.
         """
 
-        bot_id = self._get_bot_id()
+        await super().post_stats()
 
+    def _format_stats(self, stats: BotStats) -> dict[str, int]:
         kwargs = {
-            'server_count': len(self.client.guilds or [])
+            'server_count': stats.guilds
         }
 
         if self.post_shard_count:
-            kwargs['shard_count'] = self.client.shard_count or 1
-
-        await self._post_stats_handler(bot_id, **kwargs)
+            kwargs['shard_count'] = stats.shard_count
+        return kwargs
 
 
 class Client:
@@ -443,6 +954,9 @@ class Client:
     interval: Optional[:class:`float`]
         The interval in seconds to auto-post the stats.
         Defaults to 600.
+    dbl_interval: Optional[:class:`float`]
+        The interval for Discord Bot List. The same goes for ``dbgg_interval`` and ``topgg_interval``.
+        Defaults to ``interval``.
     post_shard_count: :class:`bool`
         Decides whether to post the shard count along with the server count.
         Defaults to False.
@@ -451,13 +965,62 @@ class Client:
         If False then it must be manually started with `start`.
         Defaults to True.
     session: Optional[:class:`aiohttp.ClientSession`]
-        The session for the HTTP Client.
+        The session shared by the HTTP Client of every site.
+        Defaults to a session made with :func:`toppy.http.create_session` when the bot starts.
+    limit_per_host: :class:`int`
+        The maximum amount of connections open at once to each site when ``session`` isn't passed.
+        Defaults to 10.
+    keepalive_timeout: :class:`float`
+        The amount of seconds to keep an unused connection open when ``session`` isn't passed.
+        Defaults to 30.
+    ttl_dns_cache: Optional[:class:`int`]
+        The amount of seconds to cache host lookups for when ``session`` isn't passed.
+        Defaults to 300.
+    timeout: Optional[:class:`aiohttp.ClientTimeout`]
+        The timeouts of each request when ``session`` isn't passed.
+        Defaults to 10 seconds to connect and 30 seconds in total.
+    rate_limit_backend: Optional[:class:`toppy.ratelimits.AbstractRateLimitBackend`]
+        Where rate limit buckets are stored. Use :class:`toppy.ratelimits.SQLiteRateLimitBackend`
+        to share them between processes. Defaults to storing them in memory.
+    cache: Optional[:class:`toppy.cache.ResponseCache`]
+        A cache for the responses of read endpoints. Responses aren't cached by default.
+    skip_unchanged: :class:`bool`
+        Whether autopost should skip posting stats that haven't changed since the last successful post.
+        Defaults to False.
+    min_delta: :class:`int`
+        With ``skip_unchanged``, how much a stat has to change by before it's posted again.
+        Defaults to 0.
+    max_staleness: Optional[:class:`float`]
+        With ``skip_unchanged``, the maximum amount of seconds to go without posting even if nothing changed.
+        Defaults to never.
+    retry_policy: Optional[:class:`toppy.http.RetryPolicy`]
+        How failed requests are retried. Autopost also uses it to try again sooner after a temporary failure.
+    dbl_circuit_breaker: Optional[:class:`toppy.http.CircuitBreaker`]
+        Makes requests to Discord Bot List fail fast with :exc:`toppy.CircuitOpen` while it is down.
+        The same goes for ``dbgg_circuit_breaker`` and ``topgg_circuit_breaker``.
+        Each site gets its own by default.
+    keep_raw: :class:`bool`
+        Whether models keep the data they were made from as ``raw``. Disable to save memory.
+        Defaults to True.
+    metrics: Optional[:class:`toppy.metrics.MetricsHook`]
+        Receives the latency, status, retries, rate limit waits and bytes of every request.
+    log_bodies: :class:`bool`
+        Whether to log the body of every response at the debug level.
+        Defaults to False.
+
+    Attributes
+    -----------
+    pool_stats: :class:`toppy.http.ConnectionPoolStats`
+        How the connections of the default session are used.
 
     .. versionchanged:: 1.5
         ``client`` is no longer positional only.
 
     .. versionchanged:: 2.0.0
         Add support for DiscordBotsGG
+
+    .. versionchanged:: 2.1
+        Every site shares one session.
     """
     clients: ClassVar[tuple[tuple[str, Type[BaseClient]], ...]] = (
         ('dbl', DiscordBotListClient),
@@ -473,15 +1036,19 @@ class Client:
         self.client = client
 
         self._original_options = options
-        self.__session: aiohttp.ClientSession = MISSING
+        self.start_on_ready: bool = options.get('start_on_ready', True)
+
+        self.session: Optional[aiohttp.ClientSession] = options.get('session')
+        self.pool_stats: ConnectionPoolStats = ConnectionPoolStats()
+
+        self.__clients: dict[str, BaseClient] = {}
+        self.__task: asyncio.Task = MISSING
 
-        self.__dbl: Optional[DiscordBotListClient] = None
-        self.__dbgg: Optional[DiscordBotsGGClient] = None
-        self.__topgg: Optional[TopGGClient] = None
+        self._init()
+        self._merge()
 
     def _init(self):
-        interval: int = self._original_options.get('interval', 600)
-        start_on_ready: bool = self._original_options.get('start_on_ready', True)
+        interval: float = self._original_options.get('interval', 600)
 
         for name, cls in self.clients:
             token = self._original_options.get(f'{name}_token')
@@ -490,55 +1057,117 @@ class Client:
                 continue
 
             kwargs = {
-                'interval': interval,
-                'start_on_ready': start_on_ready,
-                'session': self.__session
+                'interval': self._original_options.get(f'{name}_interval', interval),
+                # the sites are posted to by the scheduler of this class
+                'start_on_ready': False,
+                'rate_limit_backend': self._original_options.get('rate_limit_backend'),
+                'cache': self._original_options.get('cache'),
+                'skip_unchanged': self._original_options.get('skip_unchanged', False),
+                'min_delta': self._original_options.get('min_delta', 0),
+                'max_staleness': self._original_options.get('max_staleness'),
+                'retry_policy': self._original_options.get('retry_policy'),
+                'circuit_breaker': self._original_options.get(f'{name}_circuit_breaker'),
+                'keep_raw': self._original_options.get('keep_raw', True),
+                'metrics': self._original_options.get('metrics'),
+                'log_bodies': self._original_options.get('log_bodies', False)
             }
 
             if 'post_shard_count' in cls.__init__.__annotations__:
-                kwargs['post_shard_count'] = kwargs.get('post_shard_count', False)
+                kwargs['post_shard_count'] = self._original_options.get('post_shard_count', False)
 
-            client = cls(self.client, token, **kwargs)
-            setattr(self, f'__{name}', client)
+            self.__clients[name] = cls(self.client, token, **kwargs)
 
     def _merge(self) -> None:
         old_start = self.client.start
-        old_close = self.client.close
 
         # used over setup_hook for fork support
         @functools.wraps(old_start)
         async def start(*args, **kwargs) -> None:
-            self.__session = aiohttp.ClientSession(loop=self.client.loop)
-            await old_start(*args, **kwargs)
+            # the connector needs a running event loop so the session can't be made in __init__
+            if self.session is None or self.session.closed:
+                self.session = create_session(
+                    limit_per_host=self._original_options.get('limit_per_host', 10),
+                    keepalive_timeout=self._original_options.get('keepalive_timeout', 30),
+                    ttl_dns_cache=self._original_options.get('ttl_dns_cache', 300),
+                    timeout=self._original_options.get('timeout'),
+                    stats=self.pool_stats
+                )
+
+            # the clients for each site make their HTTP client when old_start is called
+            for client in self._get_clients():
+                client._session = self.session
 
-        @functools.wraps(old_close)
-        async def close() -> None:
-            await self.__session.close()
-            await old_close()
+            if self.start_on_ready:
+                self.start()
+            await old_start(*args, **kwargs)
 
         self.client.start = start  # type: ignore # "Cannot assign to method"
-        self.client.close = close  # type: ignore
 
     def _get_clients(self) -> list[BaseClient]:
-        clients = []
+        return list(self.__clients.values())
+
+    @property
+    def task(self) -> asyncio.Task:
+        """
+        The :class:`asyncio.Task` object for autopost that posts to every site.
+        """
+        return self.__task
 
-        for client, _ in self.clients:
-            instance = getattr(self, client)
-            if instance:
-                clients.append(instance)
+    def start(self) -> None:
+        """Starts the autopost task for every site.
 
-        return clients
+        Stats are collected once per tick and posted to every site that is due at the same time.
+        Sites with different intervals are spread out evenly over the shortest interval.
 
-    @copy_doc(BaseClient.start)
-    def start(self):
-        for client in self._get_clients():
-            client.start()
+        .. versionchanged:: 2.1
+            One task is used for every site.
+        """
+        self.__task = self.client.loop.create_task(self._post_task(), name='toppy_autopost')
 
     @copy_doc(BaseClient.cancel)
     def cancel(self):
-        """Cancels the task of auto posting stats."""
-        for client in self._get_clients():
-            client.cancel()
+        self.task.cancel()
+
+    def _first_posts(self, now: float) -> dict[BaseClient, float]:
+        # sites with the same interval are posted to together
+        # and each group of sites starts at a different point in the shortest interval
+        clients = self._get_clients()
+        intervals = sorted({client.interval for client in clients})
+        spacing = intervals[0] / len(intervals) if intervals else 0
+
+        return {client: now + intervals.index(client.interval) * spacing for client in clients}
+
+    async def _post_task(self) -> None:
+        await self.client.wait_until_ready()
+
+        next_posts = self._first_posts(time.monotonic())
+        if not next_posts:
+            return
+
+        while not self.client.is_closed():
+            now = time.monotonic()
+            due = [client for client, when in next_posts.items() if when <= now]
+
+            if due:
+                stats = BotStats.collect(self.client)
+                # one site failing unexpectedly shouldn't stop the others from posting
+                results = await asyncio.gather(*(client._autopost(stats) for client in due), return_exceptions=True)
+
+                for client, retry_after in zip(due, results):
+                    if isinstance(retry_after, BaseException):
+                        _log.error(
+                            'Autopost for %s failed with an unexpected exception.', client.shortened,
+                            exc_info=retry_after
+                        )
+                        retry_after = None
+
+                    if retry_after is not None:
+                        next_posts[client] = now + retry_after
+                    else:
+                        # intervals can be changed while running, like with the cog
+                        next_posts[client] = max(next_posts[client] + client.interval, now)
+
+            await asyncio.sleep(max(min(next_posts.values()) - time.monotonic(), 0))
 
     @property
     def dbl(self) -> Optional[DiscordBotListClient]:
@@ -549,7 +1178,7 @@ class Client:
         --------
         Optional[:class:`DBLCLient`]
         """
-        return self.__dbl
+        return self.__clients.get('dbl')  # type: ignore
 
     @property
     def dbgg(self) -> Optional[DiscordBotsGGClient]:
@@ -560,7 +1189,7 @@ class Client:
         --------
         Optional[:class:`DiscordBotsGGClient`]
         """
-        return self.__dbgg
+        return self.__clients.get('dbgg')  # type: ignore
 
     @property
     def topgg(self) -> Optional[TopGGClient]:
@@ -571,14 +1200,14 @@ class Client:
         --------
         Optional[:class:`TopGGClient`]
         """
-        return self.__topgg
+        return self.__clients.get('topgg')  # type: ignore
 
     async def post_stats(self) -> None:
         """Post your bots stats to all websites with a token found.
         All stats are automatically found and posted."""
-        tasks = [
-            self.client.loop.create_task(client.post_stats())
-            for client in self._get_clients()
-        ]
+        stats = BotStats.collect(self.client)
 
-        await asyncio.gather(*tasks)
+        await asyncio.gather(*(
+            client._post_stats_handler(client._get_bot_id(), **client._format_stats(stats))
+            for client in self._get_clients()
+        ))
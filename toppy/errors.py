@@ -5,6 +5,7 @@ import aiohttp
 
 __all__ = (
     'BadRequest',
+    'CircuitOpen',
     'ClientNotReady',
     'Forbidden',
     'HTTPException',
@@ -62,9 +63,28 @@ class RateLimited(HTTPException):
     
     Attributes
     -----------
-    retry_after: Optional[:class:`int`]
+    retry_after: Optional[:class:`float`]
         The amount of seconds you can retry in.
     """
-    def __init__(self, retry_after: Optional[int] = None, resp: Optional[aiohttp.ClientResponse] = None):
+    def __init__(self, retry_after: Optional[float] = None, resp: Optional[aiohttp.ClientResponse] = None):
         self.retry_after = retry_after
         super().__init__(resp, f'We have been ratelimited for the next {self.retry_after} seconds.')
+
+
+class CircuitOpen(HTTPException):
+    """
+    The site has failed too many times in a row so requests to it fail without being made.
+
+    .. versionadded:: 2.1
+
+    Attributes
+    -----------
+    site: :class:`str`
+        The base URL of the site.
+    retry_after: :class:`float`
+        The amount of seconds until a request to check if the site is back will be allowed.
+    """
+    def __init__(self, site: str, retry_after: float):
+        self.site = site
+        self.retry_after = retry_after
+        super().__init__(None, f'{site} is unavailable, retry in {retry_after:.2f} seconds.')
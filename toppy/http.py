@@ -1,22 +1,45 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-import re
+import random
 import time
-from typing import Any, Callable, ClassVar, Coroutine, Literal, Optional, TypeVar, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union
+)
 
 import aiohttp
+import yarl
 
+from .cache import ResponseCache
+from .metrics import MetricsHook
 from .errors import *
-from .utils import AsyncContextManager, MISSING
+from .ratelimits import AbstractRateLimitBackend, MemoryRateLimitBackend, RateLimiter
+from .streaming import iter_json_array
+from .utils import from_json, to_json, MISSING
 
 
 __all__ = (
     'BaseHTTPClient',
+    'CircuitBreaker',
+    'ConnectionPoolStats',
     'DiscordBotListHTTPClient',
     'DiscordBotsGGHTTPClient',
-    'TopGGHTTPClient'
+    'RetryPolicy',
+    'Route',
+    'TopGGHTTPClient',
+    'create_session'
 )
 
 
@@ -31,44 +54,418 @@ def cleanup_params(params: dict[KT, VT]) -> dict[KT, VT]:
     return {k: v for k, v in params.items() if v is not None}
 
 
-class RateLimiter:
-    def __init__(self, rate: float, per: float):
-        self.rate = rate
-        self.per = per
-
-        self.count = 0
-        self.last_reset = time.time()
+def _freeze_params(params: Optional[Mapping[str, Any]]) -> tuple:
+    if not params:
+        return ()
+    return tuple(sorted(params.items()))
+
+
+def _parse_header(headers: Mapping[str, str], name: str) -> Optional[float]:
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):  # missing or an HTTP date
+        return None
+
+
+class Route:
+    """A request to an endpoint.
+
+    ``path`` is the route template, such as ``/bots/{bot_id}/check``, and is used as the key to find the
+    rate limit buckets of the route. The parameters are only used to build the URL.
+    """
+
+    __slots__ = ('method', 'path', 'url')
+
+    def __init__(self, method: str, path: str, **parameters: Any) -> None:
+        self.method = method
+        self.path = path
+        self.url = path.format_map(parameters) if parameters else path
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} method={self.method!r} path={self.path!r}>'
+
+
+class RetryPolicy:
+    """
+    How failed requests are retried.
+
+    Requests that time out, fail to connect, are ratelimited or return a server error are retried
+    with exponential backoff and full jitter, so many clients failing at once don't retry at once.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    max_attempts: :class:`int`
+        The maximum amount of attempts for a request including the first one.
+        Defaults to 4.
+    base: :class:`float`
+        The backoff of the first retry in seconds. This is doubled every retry.
+        Defaults to 0.5.
+    cap: :class:`float`
+        The maximum backoff in seconds.
+        Defaults to 30.
+    timeout: Optional[:class:`float`]
+        The amount of seconds each attempt can take. Time spent waiting for rate limits isn't counted.
+        Defaults to 10.
+    max_retry_after: :class:`float`
+        Ratelimits longer than this amount of seconds are raised as :exc:`toppy.RateLimited` instead of waited out.
+        Defaults to 60.
+    retry_statuses: Iterable[:class:`int`]
+        The status codes of server errors to retry.
+        Defaults to 500, 502, 503 and 504.
+    """
+    def __init__(self, max_attempts: int = 4, *, base: float = 0.5, cap: float = 30, timeout: Optional[float] = 10,
+                 max_retry_after: float = 60, retry_statuses: Iterable[int] = (500, 502, 503, 504)):
+        self.max_attempts = max_attempts
+        self.base = base
+        self.cap = cap
+        self.timeout = timeout
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} max_attempts={self.max_attempts} base={self.base} cap={self.cap}>'
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the amount of seconds to wait after an attempt failed.
+
+        Parameters
+        -----------
+        attempt: :class:`int`
+            The number of attempts that failed in a row, starting at 1.
+
+        Returns
+        --------
+        :class:`float`
+        """
+        return random.uniform(0, min(self.cap, self.base * 2 ** (attempt - 1)))
+
+    def is_retryable(self, exc: HTTPException) -> bool:
+        """
+        Whether an exception was caused by a failure that can go away by itself.
+
+        Parameters
+        -----------
+        exc: :class:`toppy.HTTPException`
+            The exception raised by the request.
+
+        Returns
+        --------
+        :class:`bool`
+        """
+        return exc.resp is None or exc.resp.status == 429 or exc.resp.status in self.retry_statuses
+
+
+class CircuitBreaker:
+    """
+    Stops making requests to a site that keeps failing.
+
+    The circuit is ``closed`` while the site works. After ``failure_threshold`` connection errors, timeouts
+    or server errors in a row it opens and requests raise :exc:`toppy.CircuitOpen` without being made.
+    After ``recovery_timeout`` seconds it is ``half-open`` and lets ``half_open_max_calls`` requests through
+    to check the site. The circuit closes again if they succeed and opens again if they fail.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    failure_threshold: :class:`int`
+        The amount of failures in a row to open the circuit.
+        Defaults to 5.
+    recovery_timeout: :class:`float`
+        The amount of seconds to stay open.
+        Defaults to 30.
+    half_open_max_calls: :class:`int`
+        The amount of requests allowed at once while half-open.
+        Defaults to 1.
+    """
+    CLOSED: ClassVar[str] = 'closed'
+    OPEN: ClassVar[str] = 'open'
+    HALF_OPEN: ClassVar[str] = 'half-open'
+
+    def __init__(self, failure_threshold: int = 5, *, recovery_timeout: float = 30, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.failures: int = 0
+        self._opened_at: float = 0
+        self._probes: int = 0
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} state={self.state!r} failures={self.failures}>'
 
     @property
-    def next_reset(self) -> float:
-        return self.last_reset + self.per
-
-    async def block(self):
-        if time.time() - self.per > self.last_reset:
-            self.count = 0
-            self.last_reset = time.time()
-
-        if self.count >= self.rate:
-            sleep_until = self.next_reset - time.time()
-
-            if sleep_until <= 0:
-                return
+    def state(self) -> str:
+        """
+        The current state. One of ``closed``, ``open`` or ``half-open``.
+
+        Returns
+        --------
+        :class:`str`
+        """
+        if self.failures < self.failure_threshold:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.recovery_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def acquire(self, site: str) -> bool:
+        """
+        Check if a request can be made. Every call must be followed by :meth:`release`.
+
+        Parameters
+        -----------
+        site: :class:`str`
+            The base URL of the site for the error.
+
+        Raises
+        -------
+        :exc:`toppy.CircuitOpen`
+            The request isn't allowed.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the request is a probe made while half-open.
+        """
+        state = self.state
+
+        if state == self.CLOSED:
+            return False
+        if state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+
+        retry_after = max(self._opened_at + self.recovery_timeout - time.monotonic(), 0)
+        raise CircuitOpen(site, retry_after)
+
+    def release(self, success: Optional[bool], *, probe: bool = False) -> None:
+        """
+        Record the result of a request.
+
+        Parameters
+        -----------
+        success: Optional[:class:`bool`]
+            Whether the site worked. ``None`` if the request was cancelled before finding out.
+        probe: :class:`bool`
+            What :meth:`acquire` returned.
+        """
+        if probe:
+            self._probes -= 1
+
+        if success is None:
+            return
+
+        if success:
+            if self.failures >= self.failure_threshold:
+                _log.info('Circuit closed after the site recovered.')
+            self.failures = 0
+            return
+
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.failures == self.failure_threshold:
+                _log.warning('Circuit opened after %d failures in a row.', self.failures)
+            # a failed probe opens the circuit for another recovery_timeout
+            self._opened_at = time.monotonic()
+
+
+class ConnectionPoolStats:
+    """
+    Counts how the connections of a session are used. Pass it to :func:`create_session`.
+
+    .. versionadded:: 2.1
+
+    Attributes
+    -----------
+    requests: :class:`int`
+        The amount of requests started.
+    in_flight: :class:`int`
+        The amount of requests currently being made.
+    connections_created: :class:`int`
+        The amount of new connections opened.
+    connections_reused: :class:`int`
+        The amount of times a kept alive connection was reused.
+    queued: :class:`int`
+        The amount of times a request had to wait for a free connection.
+    queued_time: :class:`float`
+        The total amount of seconds requests waited for a free connection.
+    dns_cache_hits: :class:`int`
+        The amount of host lookups answered by the DNS cache.
+    dns_cache_misses: :class:`int`
+        The amount of host lookups that had to be resolved.
+    """
+    def __init__(self):
+        self.requests: int = 0
+        self.in_flight: int = 0
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.queued: int = 0
+        self.queued_time: float = 0
+        self.dns_cache_hits: int = 0
+        self.dns_cache_misses: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} requests={self.requests} in_flight={self.in_flight} '
+            f'connections_created={self.connections_created} connections_reused={self.connections_reused}>'
+        )
 
-            await asyncio.sleep(sleep_until)
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        The fraction of connections that were reused instead of opened.
+
+        Returns
+        --------
+        :class:`float`
+        """
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Create a :class:`aiohttp.TraceConfig` that updates these stats.
+
+        Returns
+        --------
+        :class:`aiohttp.TraceConfig`
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params) -> None:
+            self.requests += 1
+            self.in_flight += 1
+
+        async def on_request_end(session, ctx, params) -> None:
+            self.in_flight -= 1
+
+        async def on_connection_create_end(session, ctx, params) -> None:
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params) -> None:
+            self.connections_reused += 1
+
+        async def on_connection_queued_start(session, ctx, params) -> None:
+            self.queued += 1
+            # ctx is a namespace for each request
+            ctx.toppy_queued_since = time.monotonic()
+
+        async def on_connection_queued_end(session, ctx, params) -> None:
+            self.queued_time += time.monotonic() - ctx.toppy_queued_since
+
+        async def on_dns_cache_hit(session, ctx, params) -> None:
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params) -> None:
+            self.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+
+def create_session(*, limit: int = 100, limit_per_host: int = 10, keepalive_timeout: float = 30,
+                   ttl_dns_cache: Optional[int] = 300, timeout: Optional[aiohttp.ClientTimeout] = None,
+                   stats: Optional[ConnectionPoolStats] = None) -> aiohttp.ClientSession:
+    """
+    Create a session with a connection pool tuned for the bot list sites.
+    Connections are kept alive and host lookups are cached so repeated requests skip the DNS lookup and TLS handshake.
+
+    This must be called with a running event loop.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    limit: :class:`int`
+        The maximum amount of connections open at once.
+        Defaults to 100.
+    limit_per_host: :class:`int`
+        The maximum amount of connections open at once to each site.
+        Defaults to 10.
+    keepalive_timeout: :class:`float`
+        The amount of seconds to keep an unused connection open.
+        Defaults to 30.
+    ttl_dns_cache: Optional[:class:`int`]
+        The amount of seconds to cache host lookups for. ``None`` caches them forever.
+        Defaults to 300.
+    timeout: Optional[:class:`aiohttp.ClientTimeout`]
+        The timeouts of each request.
+        Defaults to 10 seconds to connect and 30 seconds in total.
+    stats: Optional[:class:`ConnectionPoolStats`]
+        Stats to update with how the connections are used.
+
+    Returns
+    --------
+    :class:`aiohttp.ClientSession`
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=ttl_dns_cache
+    )
+
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout or aiohttp.ClientTimeout(total=30, connect=10),
+        trace_configs=[stats.trace_config()] if stats is not None else None
+    )
 
 
 class BaseHTTPClient:
     BASE: ClassVar[str]
     latency: ClassVar[float] = MISSING
 
+    GLOBAL_BUCKET: ClassVar[str] = '*'
+    # bucket key -> (rate, per)
+    # the global bucket applies to every route, other keys apply to every route template they prefix
+    rate_limit_buckets: ClassVar[dict[str, tuple[float, float]]] = {}
+
+    # route template -> seconds to cache responses for when a cache is set
+    cache_ttls: ClassVar[dict[str, float]] = {}
+
     token: str
     session: aiohttp.ClientSession
 
-    def __init__(self, token, *, session: Optional[aiohttp.ClientSession] = None):
+    def __init__(self, token, *, session: Optional[aiohttp.ClientSession] = None,
+                 rate_limit_backend: Optional[AbstractRateLimitBackend] = None,
+                 cache: Optional[ResponseCache] = None, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None, metrics: Optional[MetricsHook] = None,
+                 log_bodies: bool = False):
         self.token = token
-        self.session = session or aiohttp.ClientSession()
-
-        self.rate_limits: dict[re.Pattern, RateLimiter] = {}
+        self.session = session or create_session()
+        self.cache: Optional[ResponseCache] = cache
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker()
+        self.metrics: Optional[MetricsHook] = metrics
+        # formatting every response body into the logs is slow so it is opt in
+        self.log_bodies: bool = log_bodies
+        self._site: str = yarl.URL(self.BASE).host or self.BASE
+
+        self.rate_limit_backend: AbstractRateLimitBackend = rate_limit_backend or MemoryRateLimitBackend()
+        self.rate_limits: dict[str, RateLimiter] = {
+            key: self._create_limiter(key, rate, per) for key, (rate, per) in self.rate_limit_buckets.items()
+        }
+        # route template -> buckets to consume from, resolved on the first request to the route
+        self._bucket_index: dict[str, tuple[RateLimiter, ...]] = {}
+        # (url, params) -> the GET request currently being made
+        self._in_flight: dict[tuple[str, tuple], asyncio.Future] = {}
+        # route template -> [remaining, monotonic time of the reset] for limits sent by the site whose
+        # window length isn't known yet
+        self._route_windows: dict[str, list[float]] = {}
 
     # method with signature (self, *args, **kwargs) doesn't work
     post_stats: Callable[..., Coroutine[Any, Any, Any]]
@@ -83,63 +480,348 @@ class BaseHTTPClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.session.close()
 
-    async def block(self, url: str) -> None:
-        k: re.Pattern
-        v: RateLimiter
+    def _create_limiter(self, key: str, rate: float, per: float) -> RateLimiter:
+        # namespaced by site so one backend can be shared by every client
+        return RateLimiter(rate, per, key=f'{self.BASE} {key}', backend=self.rate_limit_backend)
 
-        for k, v in self.rate_limits.items():
-            if k.search(url):
-                await v.block()
-                break  # to not allow get post aliases to get mixed up
+    def _resolve_buckets(self, path: str) -> tuple[RateLimiter, ...]:
+        keys = [key for key in self.rate_limits if key == path or path.startswith(key + '/')]
+        limiters = []
 
-    def request(self, method: str, url: str, **kwargs: Any) -> AsyncContextManager[aiohttp.ClientResponse]:
-        return AsyncContextManager(self._request(method, url, **kwargs))
+        if keys:
+            # only the most specific route bucket is used
+            limiters.append(self.rate_limits[max(keys, key=len)])
+        if self.GLOBAL_BUCKET in self.rate_limits:
+            # the global bucket goes last so a global token isn't held while waiting for the route bucket
+            limiters.append(self.rate_limits[self.GLOBAL_BUCKET])
 
-    async def _request(self, method: str, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
-        await self.block(url)
-        resp = await self.session.request(method, self.BASE + url, **kwargs, headers=self.headers)
+        self._bucket_index[path] = tuple(limiters)
+        return self._bucket_index[path]
 
+    async def block(self, route: Route) -> None:
         try:
-            data = await resp.json()
-        except aiohttp.ContentTypeError:
-            data = None
-        else:
-            async def json(*_, **__):
-                return data
-
-            # use only .json() once
-            resp.json = json  # type: ignore
-
-        _log.info(
-            '%s %s with %s has returned status %d with %s',
-            resp.method,
-            resp.url,
-            kwargs.get('data', kwargs.get('params')),
-            resp.status,
-            data
-        )
+            limiters = self._bucket_index[route.path]
+        except KeyError:
+            limiters = self._resolve_buckets(route.path)
+
+        window = self._route_windows.get(route.path)
+        if window is not None:
+            now = time.monotonic()
+            if window[0] < 1 and now < window[1]:
+                await asyncio.sleep(window[1] - now)
+                now = time.monotonic()
+            if now >= window[1]:
+                del self._route_windows[route.path]
+            else:
+                window[0] -= 1
+
+        for limiter in limiters:
+            await limiter.block()
+
+    def _route_limiter(self, route: Route) -> Optional[RateLimiter]:
+        try:
+            limiters = self._bucket_index[route.path]
+        except KeyError:
+            limiters = self._resolve_buckets(route.path)
+
+        # the route bucket always comes first
+        return limiters[0] if limiters else None
+
+    def _update_rate_limits(self, route: Route, resp: aiohttp.ClientResponse) -> None:
+        limit = _parse_header(resp.headers, 'X-RateLimit-Limit')
+        remaining = _parse_header(resp.headers, 'X-RateLimit-Remaining')
+        reset_after = _parse_header(resp.headers, 'X-RateLimit-Reset-After')
+
+        if reset_after is None:
+            reset = _parse_header(resp.headers, 'X-RateLimit-Reset')
+            if reset is not None:
+                if reset > 1e12:  # unix timestamp in milliseconds
+                    reset /= 1000
+                if reset > 1e9:  # unix timestamp in seconds
+                    reset -= time.time()
+                reset_after = max(reset, 0)
+
+        if limit is None and remaining is None:
+            return
+
+        # reset_after is only the length of the window on the first request of a window
+        per = None
+        if limit is not None and remaining is not None and reset_after and remaining >= limit - 1:
+            per = reset_after
+
+        limiter = self._route_limiter(route)
+
+        if limiter is None:
+            if limit is None or not reset_after:
+                return
+
+            if per is None:
+                # the window length is unknown so only this window is respected until a new one starts
+                if remaining is not None:
+                    self._route_windows[route.path] = [remaining, time.monotonic() + reset_after]
+                return
 
-        if resp.ok:
-            return resp
-
-        if resp.status == 400:
-            raise BadRequest(resp)
-        elif resp.status == 401:
-            raise Unauthorized(resp)
-        elif resp.status == 403:
-            raise Forbidden(resp)
-        elif resp.status == 429:
-            _log.warning(
-                'Route %s has been ratelimited for %f seconds.',
-                data['retry-after']
+            # the site told us about a limit we didn't know of
+            _log.debug(
+                'Creating a bucket for route %s with %s requests per %s seconds.',
+                route.path,
+                limit,
+                per
             )
+            self._route_windows.pop(route.path, None)
+            self.rate_limits[route.path] = self._create_limiter(route.path, limit, per)
+            self._bucket_index.clear()
+            limiter = self.rate_limits[route.path]
+
+        limiter.update(limit, remaining, reset_after, per=per)
+
+    @staticmethod
+    def _get_retry_after(resp: aiohttp.ClientResponse, data: Any) -> Optional[float]:
+        retry_after = _parse_header(resp.headers, 'Retry-After')
+        if retry_after is None and isinstance(data, dict):
+            retry_after = data.get('retry-after', data.get('retry_after'))
+        return retry_after
+
+    async def request(self, route: Route, **kwargs: Any) -> Any:
+        """Make a request and return the decoded JSON.
+
+        Identical ``GET`` requests that are made while one is already in flight wait for it
+        and share its result instead of making another request. If a cache is set ``GET`` requests
+        are looked up in it first. The result must not be mutated.
+        """
+        if route.method != 'GET':
+            _, data = await self._request(route, **kwargs)
+            return data
+
+        # the base is part of the key so one cache can be shared by every site
+        key = (self.BASE + route.url, _freeze_params(kwargs.get('params')))
+        ttl = self.cache.get_ttl(route.path, self.cache_ttls.get(route.path)) if self.cache is not None else None
+
+        if ttl is not None:
+            entry = self.cache.get(key)  # type: ignore # ttl is only set with a cache
+
+            if entry is not None:
+                if entry.stale:
+                    # refresh in the background, the in flight request keeps a reference to it
+                    self._get_in_flight(key, route, ttl, **kwargs)
+                return entry.value
+
+        joined = key in self._in_flight
+        future = self._get_in_flight(key, route, ttl, **kwargs)
+        if ttl is not None:
+            # one miss per request made, everyone joining it was saved a request
+            if joined:
+                self.cache.coalesced += 1  # type: ignore
+            else:
+                self.cache.misses += 1  # type: ignore
+
+        # shielded so one caller being cancelled doesn't cancel the request for everyone else
+        return await asyncio.shield(future)
+
+    def _get_in_flight(self, key: tuple[str, tuple], route: Route, ttl: Optional[float],
+                       **kwargs: Any) -> asyncio.Future:
+        try:
+            future = self._in_flight[key]
+        except KeyError:
+            future = self._in_flight[key] = asyncio.ensure_future(self._cached_request(key, route, ttl, **kwargs))
+            future.add_done_callback(functools.partial(self._request_done, key))
+        else:
+            _log.debug('Joining the in flight request to %s', route.url)
+
+        return future
+
+    async def _cached_request(self, key: tuple[str, tuple], route: Route, ttl: Optional[float],
+                              **kwargs: Any) -> Any:
+        if ttl is None or self.cache is None:
+            _, data = await self._request(route, **kwargs)
+            return data
+
+        # an expired response can still be revalidated if the site sent validators with it
+        entry = self.cache.peek(key)
+        headers = {}
+
+        if entry is not None:
+            if entry.etag is not None:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified is not None:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        resp, data = await self._request(route, headers=headers, **kwargs)
+
+        if resp.status == 304 and entry is not None:
+            _log.debug('%s has not been modified.', route.url)
+            data = entry.value
+            etag = resp.headers.get('ETag', entry.etag)
+            last_modified = resp.headers.get('Last-Modified', entry.last_modified)
+        else:
+            etag = resp.headers.get('ETag')
+            last_modified = resp.headers.get('Last-Modified')
 
-            if data['retry-after'] <= 60:
-                await asyncio.sleep(data['retry-after'])
-                return await self._request(method, url, **kwargs)
-            raise RateLimited(data['retry-after'], resp)
-            # Top.gg ratelimits can be too long for a reasonable retry
-        raise HTTPException(resp, f'Status: {resp.status}')
+        self.cache.set(key, data, ttl, etag=etag, last_modified=last_modified)
+        return data
+
+    def _request_done(self, key: tuple[str, tuple], future: asyncio.Future) -> None:
+        del self._in_flight[key]
+
+        if not future.cancelled():
+            # mark the exception as retrieved in case every caller was cancelled
+            future.exception()
+
+    async def stream(self, route: Route, key: Optional[str] = None, **kwargs: Any) -> AsyncGenerator[Any, None]:
+        """Make a request and yield the items of the JSON array in the response as they are received.
+
+        Retries, rate limits and errors are handled like :meth:`request` until the response starts.
+        Streamed requests are never cached or shared.
+
+        .. versionadded:: 2.1
+        """
+        resp, _ = await self._request(route, stream=True, **kwargs)
+
+        try:
+            async with resp:
+                async for item in iter_json_array(resp.content, key):
+                    yield item
+        finally:
+            if self.metrics is not None:
+                self.metrics.on_bytes(self._site, route.path, 0, resp.content.total_bytes)
+
+    async def _send(self, route: Route, headers: dict[str, str], *, stream: bool = False,
+                    **kwargs: Any) -> tuple[aiohttp.ClientResponse, Any]:
+        resp = await self.session.request(route.method, self.BASE + route.url, **kwargs, headers=headers)
+        self._update_rate_limits(route, resp)
+
+        if stream and resp.ok:
+            # the body is read and the response released by the caller
+            return resp, None
+
+        async with resp:
+            try:
+                data = await resp.json(loads=from_json)
+            except aiohttp.ContentTypeError:
+                data = None
+
+        if self.metrics is not None:
+            body = kwargs.get('data')
+            if isinstance(body, str):
+                body = body.encode()
+            sent = len(body) if isinstance(body, bytes) else 0
+            self.metrics.on_bytes(self._site, route.path, sent, resp.content.total_bytes)
+
+        return resp, data
+
+    async def _attempt(
+            self, route: Route, headers: dict[str, str], **kwargs: Any
+    ) -> tuple[aiohttp.ClientResponse, Any]:
+        # fail before waiting for the rate limit if the site is down
+        probe = self.circuit_breaker.acquire(self.BASE)
+        success = None
+
+        metrics = self.metrics
+        status = None
+
+        try:
+            if metrics is not None:
+                start = time.perf_counter()
+                await self.block(route)
+                metrics.on_rate_limit_wait(self._site, route.path, time.perf_counter() - start)
+            else:
+                await self.block(route)
+
+            start = time.perf_counter()
+            resp, data = await asyncio.wait_for(self._send(route, headers, **kwargs), self.retry_policy.timeout)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            success = False
+            raise
+        else:
+            status = resp.status
+            success = status not in self.retry_policy.retry_statuses
+            return resp, data
+        finally:
+            self.circuit_breaker.release(success, probe=probe)
+
+            # not reported if the request was never made
+            if metrics is not None and success is not None:
+                metrics.on_request(self._site, route.path, route.method, status, time.perf_counter() - start)
+
+    def _report_retry(self, route: Route, reason: str) -> None:
+        if self.metrics is not None:
+            self.metrics.on_retry(self._site, route.path, route.method, reason)
+
+    async def _request(self, route: Route, *, headers: Optional[dict[str, str]] = None,
+                       **kwargs: Any) -> tuple[aiohttp.ClientResponse, Any]:
+        headers = {**self.headers, **headers} if headers else self.headers
+        policy = self.retry_policy
+
+        if 'json' in kwargs:
+            # encoded once with the configured codec instead of by aiohttp on every attempt,
+            # as bytes so the metrics count the bytes sent instead of the characters
+            kwargs['data'] = to_json(kwargs.pop('json')).encode()
+            headers = {**headers, 'Content-Type': 'application/json'}
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                resp, data = await self._attempt(route, headers, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                if attempt >= policy.max_attempts:
+                    raise HTTPException(message=f'{route.method} {route.url} failed: {exc!r}') from exc
+
+                delay = policy.backoff(attempt)
+                _log.warning('%s %s failed with %r, retrying in %.2f seconds.', route.method, route.url, exc, delay)
+                self._report_retry(route, 'connection')
+                await asyncio.sleep(delay)
+                continue
+
+            if self.log_bodies:
+                _log.debug(
+                    '%s %s with %s has returned status %d with %s',
+                    resp.method,
+                    resp.url,
+                    kwargs.get('data', kwargs.get('params')),
+                    resp.status,
+                    data
+                )
+            else:
+                _log.debug('%s %s has returned status %d', resp.method, resp.url, resp.status)
+
+            if resp.ok:
+                return resp, data
+
+            if resp.status == 400:
+                raise BadRequest(resp)
+            elif resp.status == 401:
+                raise Unauthorized(resp)
+            elif resp.status == 403:
+                raise Forbidden(resp)
+            elif resp.status == 429:
+                retry_after = self._get_retry_after(resp, data)
+                _log.warning('Route %s has been ratelimited for %s seconds.', route.path, retry_after)
+
+                # Top.gg ratelimits can be too long for a reasonable retry
+                if (retry_after is not None and retry_after > policy.max_retry_after) or attempt >= policy.max_attempts:
+                    raise RateLimited(retry_after, resp)
+
+                if retry_after is None:
+                    retry_after = policy.backoff(attempt)
+
+                self._report_retry(route, 'rate_limit')
+                limiter = self._route_limiter(route)
+                if limiter is not None:
+                    # every other request to the route waits as well
+                    limiter.delay(retry_after)
+                else:
+                    await asyncio.sleep(retry_after)
+                continue
+            elif resp.status in policy.retry_statuses and attempt < policy.max_attempts:
+                delay = policy.backoff(attempt)
+                _log.warning('%s %s returned status %d, retrying in %.2f seconds.', route.method, route.url,
+                             resp.status, delay)
+                self._report_retry(route, 'server_error')
+                await asyncio.sleep(delay)
+                continue
+            raise HTTPException(resp, f'Status: {resp.status}')
 
 
 class DiscordBotListHTTPClient(BaseHTTPClient):
@@ -153,26 +835,28 @@ class DiscordBotListHTTPClient(BaseHTTPClient):
             'guilds': guilds
         }
 
-        await self.request('POST', f'/bots/{bot_id}/stats', params=data)
+        await self.request(Route('POST', '/bots/{bot_id}/stats', bot_id=bot_id), params=data)
 
 
 class DiscordBotsGGHTTPClient(BaseHTTPClient):
     BASE = 'https://discord.bots.gg/api/v1'
 
-    def __init__(self, token, *, session: Optional[aiohttp.ClientSession] = None):
-        super().__init__(token, session=session)
-
-        self.rate_limits: dict[re.Pattern, RateLimiter] = {
-            re.compile(r'/bots/\d{15,20}'): RateLimiter(1, 5),
-            re.compile('/bots'): RateLimiter(10, 5)
-        }
-
-    async def search_bots(self, query: Optional[str] = None, *, page: Optional[int] = None, limit: Optional[int] = None,
-                          author_id: Optional[int] = None, author: Optional[str] = None,
-                          unverified: Optional[bool] = None, lib: Optional[str] = None,
-                          sort: Literal['username', 'id', 'guildcount', 'library', 'author'] = 'guildcount',
-                          order: Optional[Literal['ASC', 'DESC']] = None) -> dict[str, Any]:
-        params = cleanup_params({
+    rate_limit_buckets = {
+        '/bots/{bot_id}': (1, 5),
+        '/bots': (10, 5)
+    }
+    cache_ttls = {
+        '/bots/{bot_id}': 300,
+        '/bots': 300
+    }
+
+    @staticmethod
+    def _search_params(query: Optional[str] = None, *, page: Optional[int] = None, limit: Optional[int] = None,
+                       author_id: Optional[int] = None, author: Optional[str] = None,
+                       unverified: Optional[bool] = None, lib: Optional[str] = None,
+                       sort: Literal['username', 'id', 'guildcount', 'library', 'author'] = 'guildcount',
+                       order: Optional[Literal['ASC', 'DESC']] = None) -> dict[str, Any]:
+        return cleanup_params({
             'q': query,
             'page': page,
             'limit': limit,
@@ -183,32 +867,37 @@ class DiscordBotsGGHTTPClient(BaseHTTPClient):
             'sort': sort,
             'order': order
         })
-        async with self.request('GET', '/bots', params=params) as resp:
-            data = await resp.json()
-        return data['results']
+
+    async def search_bots(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return await self.request(Route('GET', '/bots'), params=self._search_params(*args, **kwargs))
+
+    async def stream_search_bots(self, *args: Any, **kwargs: Any) -> AsyncGenerator[dict[str, Any], None]:
+        async for bot in self.stream(Route('GET', '/bots'), 'bots', params=self._search_params(*args, **kwargs)):
+            yield bot
 
     async def search_one_bot(self, bot_id: int, /) -> dict[str, Any]:
-        async with self.request('GET', f'/bots/{bot_id}') as resp:
-            return await resp.json()
+        return await self.request(Route('GET', '/bots/{bot_id}', bot_id=bot_id))
 
     async def post_stats(self, bot_id: int, *, guild_count: int, shard_count: Optional[int] = None):
         data = cleanup_params({
             'guildCount': guild_count,
             'shardCount': shard_count
         })
-        await self.request('POST', f'bots/{bot_id}/stats', json=data)
+        await self.request(Route('POST', '/bots/{bot_id}/stats', bot_id=bot_id), json=data)
 
 
 class TopGGHTTPClient(BaseHTTPClient):
     BASE = 'https://top.gg/api'
 
-    def __init__(self, token, *, session: Optional[aiohttp.ClientSession] = None):
-        super().__init__(token, session=session)
-
-        self.rate_limits: dict[re.Pattern, RateLimiter] = {
-            re.compile('/'): RateLimiter(100, 1),
-            re.compile('/bots'): RateLimiter(60, 60)
-        }
+    rate_limit_buckets = {
+        BaseHTTPClient.GLOBAL_BUCKET: (100, 1),
+        '/bots': (60, 60)
+    }
+    cache_ttls = {
+        '/bots/{bot_id}': 300,
+        '/bots/{bot_id}/votes': 60,
+        '/bots': 300
+    }
 
     async def search_bots(self, search: str, *, limit: Optional[int] = None,
                           offset: Optional[int] = None) -> list[dict[str, Any]]:
@@ -217,22 +906,32 @@ class TopGGHTTPClient(BaseHTTPClient):
             'limit': limit,
             'offset': offset,
         })
-        async with self.request('GET', '/bots', params=params) as resp:
-            data = await resp.json()
+        data = await self.request(Route('GET', '/bots'), params=params)
         return data['results']
 
+    async def stream_search_bots(self, search: str, *, limit: Optional[int] = None,
+                                 offset: Optional[int] = None) -> AsyncGenerator[dict[str, Any], None]:
+        params = cleanup_params({
+            'search': search,
+            'limit': limit,
+            'offset': offset,
+        })
+        async for bot in self.stream(Route('GET', '/bots'), 'results', params=params):
+            yield bot
+
     async def search_one_bot(self, bot_id: int, /) -> dict[str, Any]:
-        async with self.request('GET', f'/bots/{bot_id}') as resp:
-            return await resp.json()
+        return await self.request(Route('GET', '/bots/{bot_id}', bot_id=bot_id))
 
     async def last_1000_votes(self, bot_id: int, /) -> list[dict[str, Union[str, list[str]]]]:
-        async with self.request('GET', f'/bots/{bot_id}/votes') as resp:
-            return await resp.json()
+        return await self.request(Route('GET', '/bots/{bot_id}/votes', bot_id=bot_id))
+
+    async def stream_last_1000_votes(self, bot_id: int, /) -> AsyncGenerator[dict[str, Union[str, list[str]]], None]:
+        async for user in self.stream(Route('GET', '/bots/{bot_id}/votes', bot_id=bot_id)):
+            yield user
 
     async def user_vote(self, bot_id: int, user_id: int) -> bool:
-        async with self.request('GET', f'/bots/{bot_id}/check', params={'userId': user_id}) as resp:
-            data = await resp.json()
-        return data['voted'] is True
+        data = await self.request(Route('GET', '/bots/{bot_id}/check', bot_id=bot_id), params={'userId': user_id})
+        return bool(data['voted'])
 
     async def post_stats(self, bot_id: int, *, server_count: Union[int, list], shard_count: Optional[int] = None
                          ) -> None:
@@ -240,4 +939,4 @@ class TopGGHTTPClient(BaseHTTPClient):
             'server_count': server_count,
             'shard_count': shard_count
         })
-        await self.request('POST', f'/bots/{bot_id}/stats', json=data)
+        await self.request(Route('POST', '/bots/{bot_id}/stats', bot_id=bot_id), json=data)
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+import aiohttp
+from aiohttp import web
+
+
+__all__ = (
+    'MetricsHook',
+    'PrometheusMetrics'
+)
+
+
+class MetricsHook:
+    """
+    Receives measurements of the requests made by the HTTP clients. Pass an instance as ``metrics`` to any client.
+
+    Every method does nothing by default so only the ones needed have to be overridden.
+    They are called from the event loop and must not block.
+
+    ``site`` is the host of the site and ``route`` is the route template such as ``/bots/{bot_id}``.
+
+    .. versionadded:: 2.1
+    """
+
+    def on_request(self, site: str, route: str, method: str, status: Optional[int], latency: float) -> None:
+        """
+        Called when an attempt of a request finishes.
+
+        Parameters
+        -----------
+        site: :class:`str`
+            The host of the site.
+        route: :class:`str`
+            The route template.
+        method: :class:`str`
+            The HTTP method.
+        status: Optional[:class:`int`]
+            The status of the response. ``None`` if the attempt failed without a response.
+        latency: :class:`float`
+            The amount of seconds until the response was received.
+        """
+
+    def on_retry(self, site: str, route: str, method: str, reason: str) -> None:
+        """
+        Called when a request is going to be retried.
+
+        Parameters
+        -----------
+        reason: :class:`str`
+            One of ``connection``, ``rate_limit`` or ``server_error``.
+        """
+
+    def on_rate_limit_wait(self, site: str, route: str, seconds: float) -> None:
+        """
+        Called after a request waited for the rate limit.
+
+        Parameters
+        -----------
+        seconds: :class:`float`
+            The amount of seconds waited. This is ``0`` if a request could be made right away.
+        """
+
+    def on_bytes(self, site: str, route: str, sent: int, received: int) -> None:
+        """
+        Called with the amount of bytes of a request and its response body.
+        """
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Create a :class:`aiohttp.TraceConfig` that reports the requests of any session to this hook.
+
+        Only :meth:`on_request` and :meth:`on_bytes` are called. Routes are the path of the URL unless
+        the request was made with a ``trace_request_ctx`` dict with a ``route`` key.
+        Don't add it to a session used by a client with the same hook or requests are counted twice.
+
+        Returns
+        --------
+        :class:`aiohttp.TraceConfig`
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        def labels(ctx: Any, url: Any) -> tuple[str, str]:
+            request_ctx = ctx.trace_request_ctx
+            route = request_ctx.get('route') if isinstance(request_ctx, dict) else None
+            return url.host or '', route or url.path
+
+        async def on_request_start(session, ctx, params) -> None:
+            ctx.toppy_start = time.perf_counter()
+
+        async def on_request_end(session, ctx, params) -> None:
+            site, route = labels(ctx, params.url)
+            latency = time.perf_counter() - ctx.toppy_start
+            self.on_request(site, route, params.method, params.response.status, latency)
+
+        async def on_request_exception(session, ctx, params) -> None:
+            site, route = labels(ctx, params.url)
+            self.on_request(site, route, params.method, None, time.perf_counter() - ctx.toppy_start)
+
+        async def on_request_chunk_sent(session, ctx, params) -> None:
+            site, route = labels(ctx, params.url)
+            self.on_bytes(site, route, len(params.chunk), 0)
+
+        async def on_response_chunk_received(session, ctx, params) -> None:
+            site, route = labels(ctx, params.url)
+            self.on_bytes(site, route, 0, len(params.chunk))
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+        trace_config.on_response_chunk_received.append(on_response_chunk_received)
+        return trace_config
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names: Iterable[str], values: Iterable[Any]) -> str:
+    return ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+
+
+class PrometheusMetrics(MetricsHook):
+    """
+    A :class:`MetricsHook` that keeps totals and latency histograms in the Prometheus text format.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    buckets: Iterable[:class:`float`]
+        The upper bounds in seconds of the latency histogram buckets.
+    prefix: :class:`str`
+        The prefix of every metric name.
+        Defaults to ``toppy``.
+
+    Example
+    ----------
+    .. code:: py
+
+        metrics = toppy.metrics.PrometheusMetrics()
+        client = toppy.Client(bot, topgg_token=..., metrics=metrics)
+
+        app.router.add_get('/metrics', metrics.handler)
+    """
+    def __init__(self, buckets: Iterable[float] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10), *, prefix: str = 'toppy'):
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.prefix = prefix
+
+        # (site, route, method) -> [count of each bucket..., sum, count]
+        self._latency: dict[tuple[str, str, str], list[float]] = {}
+        self._responses: Counter[tuple[str, str, str, str]] = Counter()
+        self._retries: Counter[tuple[str, str, str, str]] = Counter()
+        # (site, route) -> [sum, count]
+        self._rate_limit_wait: dict[tuple[str, str], list[float]] = {}
+        self._sent: Counter[tuple[str, str]] = Counter()
+        self._received: Counter[tuple[str, str]] = Counter()
+
+    def on_request(self, site: str, route: str, method: str, status: Optional[int], latency: float) -> None:
+        key = (site, route, method)
+        self._responses[(site, route, method, str(status) if status is not None else 'error')] += 1
+
+        try:
+            histogram = self._latency[key]
+        except KeyError:
+            histogram = self._latency[key] = [0] * (len(self.buckets) + 2)
+
+        for index, bound in enumerate(self.buckets):
+            if latency <= bound:
+                histogram[index] += 1
+                break
+        histogram[-2] += latency
+        histogram[-1] += 1
+
+    def on_retry(self, site: str, route: str, method: str, reason: str) -> None:
+        self._retries[(site, route, method, reason)] += 1
+
+    def on_rate_limit_wait(self, site: str, route: str, seconds: float) -> None:
+        try:
+            summary = self._rate_limit_wait[(site, route)]
+        except KeyError:
+            summary = self._rate_limit_wait[(site, route)] = [0, 0]
+
+        summary[0] += seconds
+        summary[1] += 1
+
+    def on_bytes(self, site: str, route: str, sent: int, received: int) -> None:
+        if sent:
+            self._sent[(site, route)] += sent
+        if received:
+            self._received[(site, route)] += received
+
+    def render(self) -> str:
+        """
+        Get every metric in the Prometheus text exposition format.
+
+        Returns
+        --------
+        :class:`str`
+        """
+        prefix = self.prefix
+        lines = []
+
+        def header(name: str, kind: str, description: str) -> None:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+
+        header('request_duration_seconds', 'histogram', 'The latency of each attempt of a request.')
+        for key, histogram in self._latency.items():
+            labels = _labels(('site', 'route', 'method'), key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram):
+                cumulative += count
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram[-1]}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{{labels}}} {histogram[-2]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{{labels}}} {histogram[-1]}')
+
+        header('responses_total', 'counter', 'The amount of responses by status.')
+        for key, count in self._responses.items():
+            lines.append(f'{prefix}_responses_total{{{_labels(("site", "route", "method", "status"), key)}}} {count}')
+
+        header('retries_total', 'counter', 'The amount of retried attempts by reason.')
+        for key, count in self._retries.items():
+            lines.append(f'{prefix}_retries_total{{{_labels(("site", "route", "method", "reason"), key)}}} {count}')
+
+        header('rate_limit_wait_seconds', 'summary', 'The time spent waiting for rate limits.')
+        for key, (total, count) in self._rate_limit_wait.items():
+            labels = _labels(('site', 'route'), key)
+            lines.append(f'{prefix}_rate_limit_wait_seconds_sum{{{labels}}} {total}')
+            lines.append(f'{prefix}_rate_limit_wait_seconds_count{{{labels}}} {count}')
+
+        header('sent_bytes_total', 'counter', 'The amount of bytes sent in request bodies.')
+        for key, count in self._sent.items():
+            lines.append(f'{prefix}_sent_bytes_total{{{_labels(("site", "route"), key)}}} {count}')
+
+        header('received_bytes_total', 'counter', 'The amount of bytes received in response bodies.')
+        for key, count in self._received.items():
+            lines.append(f'{prefix}_received_bytes_total{{{_labels(("site", "route"), key)}}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+    async def handler(self, request: web.Request) -> web.Response:
+        """
+        An :mod:`aiohttp.web` handler that responds with :meth:`render`.
+        """
+        return web.Response(
+            body=self.render().encode(),
+            headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+        )
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import datetime
 from dataclasses import dataclass
-from functools import cached_property
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from .abc import Snowflake
@@ -17,7 +16,22 @@ __all__ = (
 )
 
 
+def _parse_datetime(value: Optional[str]) -> Optional[datetime.datetime]:
+    if not value:
+        return None
+    # fromisoformat only accepts a trailing Z from python 3.11
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.datetime.fromisoformat(value)
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
 class BaseModel:
+    __slots__ = ()
+
     id: int
 
     def __eq__(self, other: Snowflake):
@@ -32,6 +46,8 @@ class DiscordBotsGGOwner(BaseModel):
     .. versionchanged:: 2.0.1
         `user_id` renamed to `id`.
     """
+    __slots__ = ('username', 'discriminator', 'id')
+
     username: str
     discriminator: int
     id: int
@@ -45,169 +61,129 @@ class DiscordBotsGGBot(BaseModel):
     A class that represents a bot on DiscordBotsGG, not on discord.
 
     .. versionadded:: 2.0
-    """
 
-    def __init__(self, data: dict) -> None:
-        self._data = data
+    .. versionchanged:: 2.1
+        The data is parsed once when the bot is created.
 
-    def __str__(self) -> str:
-        return self.name
+    Parameters
+    -----------
+    data: :class:`dict`
+        The data sent by DiscordBotsGG.
+    keep_raw: :class:`bool`
+        Whether to keep ``data`` as :attr:`raw`. Dropping it saves memory when many bots are kept.
+        Defaults to True.
 
-    @property
-    def id(self) -> int:
-        """
+    Attributes
+    -----------
+    id: :class:`int`
         The id of the bot.
-        """
-        return self._data['userId']
-
-    @property
-    def name(self) -> str:
-        """
+    name: :class:`str`
         The username of the bot.
-        """
-        return self._data['username']
-
-    @property
-    def discriminator(self) -> int:
-        """
+    discriminator: :class:`int`
         The discriminator of the bot.
-        """
-        return int(self._data['discriminator'])
-
-    @property
-    def avatar(self) -> str:
-        """
+    avatar: :class:`str`
         The avatar url of the bot's avatar.
-        """
-        return self._data['avatarURL']
-
-    @property
-    def co_owners(self) -> list[int]:
-        """
+    co_owners: list[:class:`int`]
         Snowflakes of the co-owners of the bot.
-        """
-        return self._data['coOwners']
-
-    @property
-    def prefix(self) -> str:
-        """
+    prefix: :class:`str`
         The prefix of the bot.
-        """
-        return self._data['prefix']
-
-    @property
-    def help_command(self) -> str:
-        """
+    help_command: :class:`str`
         The text to invoke the help command for the bot.
-        """
-        return self._data['helpCommand']
-
-    @property
-    def library_name(self) -> str:
-        """
+    library_name: :class:`str`
         The library the bot is made with.
-        """
-        return self._data['libraryName']
-
-    @property
-    def website(self) -> str:
-        """
+    website: Optional[:class:`str`]
         The website url of the bot.
-        """
-        return self._data['website']
-
-    @property
-    def support_invite(self) -> Optional[str]:
-        """
+    support_invite: Optional[:class:`str`]
         The support server invite code of the bot.
-        """
-        return self._data['supportInvite']
-
-    @property
-    def bot_invite(self) -> str:
-        """
+    bot_invite: Optional[:class:`str`]
         The custom bot invite url of the bot.
-        """
-        return self._data['supportInvite']
-
-    @property
-    def short_description(self) -> str:
-        """
+    short_description: :class:`str`
         The short description of the bot.
-        """
-        return self._data['shortdesc']
-
-    @property
-    def long_description(self) -> Optional[str]:
-        """
+    long_description: Optional[:class:`str`]
         The long description of the bot. Can contain HTML and/or Markdown.
-        """
-        return self._data.get('longdesc')
-
-    @property
-    def open_source(self) -> Optional[str]:
-        """
+    open_source: Optional[:class:`str`]
         A url to the code repository of the bot.
-        """
-        return self._data['openSource']
-
-    @property
-    def guild_count(self) -> Optional[int]:
-        """
+    guild_count: Optional[:class:`int`]
         The amount of guilds the bot has according to posted stats.
-        """
-        return self._data.get('server_count')
-
-    @property
-    def shard_count(self) -> Optional[int]:
-        """
+    shard_count: Optional[:class:`int`]
         The amount of shards the bot has according to posted stats.
-        """
-        return self._data.get('shard_count')
-
-    @property
-    def verified(self) -> bool:
-        """
+    verified: :class:`bool`
         Whether the bot has been verified yet.
-        """
-        return self._data['verified']
-
-    @property
-    def online(self) -> bool:
-        """
+    online: :class:`bool`
         Whether the bot is online.
-        """
-        return self._data['online']
-
-    @cached_property
-    def in_guild(self) -> bool:
-        """
+    in_guild: :class:`bool`
         Whether the bot is in the DiscordBotsGG guild.
-        """
-        return self._data['inGuild']
-
-    @cached_property
-    def owner(self) -> DiscordBotsGGOwner:
-        """
+    owner: Optional[:class:`DiscordBotsGGOwner`]
         The owner of the bot.
-        """
-        owner = self._data['owner']
-        return DiscordBotsGGOwner(
+    date_of_approval: Optional[:class:`datetime.datetime`]
+        The date when the bot was added.
+    status: :class:`str`
+        The current status of the bot.
+    raw: Optional[:class:`dict`]
+        The data sent by DiscordBotsGG. ``None`` if ``keep_raw`` is False.
+
+        .. versionadded:: 2.1
+    """
+    __slots__ = (
+        'id',
+        'name',
+        'discriminator',
+        'avatar',
+        'co_owners',
+        'prefix',
+        'help_command',
+        'library_name',
+        'website',
+        'support_invite',
+        'bot_invite',
+        'short_description',
+        'long_description',
+        'open_source',
+        'guild_count',
+        'shard_count',
+        'verified',
+        'online',
+        'in_guild',
+        'owner',
+        'date_of_approval',
+        'status',
+        'raw'
+    )
+
+    def __init__(self, data: dict, *, keep_raw: bool = True) -> None:
+        self.id: int = int(data['userId'])
+        self.name: str = data['username']
+        self.discriminator: int = int(data['discriminator'])
+        self.avatar: str = data.get('avatarURL')
+        self.co_owners: list[int] = data.get('coOwners', [])
+        self.prefix: str = data.get('prefix')
+        self.help_command: str = data.get('helpCommand')
+        self.library_name: str = data.get('libraryName')
+        self.website: Optional[str] = data.get('website')
+        self.support_invite: Optional[str] = data.get('supportInvite')
+        self.bot_invite: Optional[str] = data.get('botInvite')
+        self.short_description: str = data.get('shortDescription', data.get('shortdesc'))
+        self.long_description: Optional[str] = data.get('longDescription', data.get('longdesc'))
+        self.open_source: Optional[str] = data.get('openSource')
+        self.guild_count: Optional[int] = _parse_int(data.get('guildCount', data.get('server_count')))
+        self.shard_count: Optional[int] = _parse_int(data.get('shardCount', data.get('shard_count')))
+        self.verified: bool = data.get('verified', False)
+        self.online: bool = data.get('online', False)
+        self.in_guild: bool = data.get('inGuild', False)
+        self.date_of_approval: Optional[datetime.datetime] = _parse_datetime(data.get('addedDate'))
+        self.status: str = data.get('status')
+
+        owner = data.get('owner')
+        self.owner: Optional[DiscordBotsGGOwner] = DiscordBotsGGOwner(
             owner['username'],
             int(owner['discriminator']),
             int(owner['userId'])
-        )
+        ) if owner else None
 
-    @property
-    def date_of_approval(self) -> datetime.datetime:
-        return datetime.datetime.fromisoformat(self._data['addedDate'])
+        self.raw: Optional[dict] = data if keep_raw else None
 
-    @property
-    def status(self) -> str:
-        """
-        The current status of the bot.
-        """
-        return self._data['status']
+    def __str__(self) -> str:
+        return self.name
 
 
 class TopGGBot(BaseModel):
@@ -216,160 +192,119 @@ class TopGGBot(BaseModel):
 
     .. versionchanged:: 2.0
         Renamed to `TopGGBot`
-    """
 
-    def __init__(self, data: dict) -> None:
-        self._data = data
+    .. versionchanged:: 2.1
+        The data is parsed once when the bot is created.
 
-    def __str__(self) -> str:
-        return f'{self.name}#{self.discriminator}'
+    Parameters
+    -----------
+    data: :class:`dict`
+        The data sent by Top.gg.
+    keep_raw: :class:`bool`
+        Whether to keep ``data`` as :attr:`raw`. Dropping it saves memory when many bots are kept.
+        Defaults to True.
 
-    @property
-    def id(self) -> int:
-        """
+    Attributes
+    -----------
+    id: :class:`int`
         The id of the bot.
-        """
-        return int(self._data['id'])
-
-    @property
-    def name(self) -> str:
-        """
+    name: :class:`str`
         The username of the bot.
-        """
-        return self._data['username']
-
-    @property
-    def discriminator(self) -> int:
-        """
+    discriminator: :class:`int`
         The discriminator of the bot.
-        """
-        return int(self._data['discriminator'])
-
-    @property
-    def avatar(self) -> str:
-        """
+    avatar: Optional[:class:`str`]
         The avatar hash of the bot's avatar.
-        """
-        return self._data.get('avatar') or self._data['defAvatar']
-
-    @property
-    def prefix(self) -> str:
-        """
+    prefix: :class:`str`
         The prefix of the bot.
-        """
-        return self._data['prefix']
-
-    @property
-    def short_description(self) -> str:
-        """
+    short_description: :class:`str`
         The short description of the bot.
-        """
-        return self._data['shortdesc']
-
-    @property
-    def long_description(self) -> str:
-        """
+    long_description: Optional[:class:`str`]
         The long description of the bot. Can contain HTML and/or Markdown.
-        """
-        return self._data['longdesc']
-
-    @property
-    def tags(self) -> list[str]:
-        """
+    tags: list[:class:`str`]
         The tags of the bot.
-        """
-        return self._data['tags']
-
-    @property
-    def website(self) -> Optional[str]:
-        """
+    website: Optional[:class:`str`]
         The website url of the bot.
-        """
-        return self._data.get('website')
-
-    @property
-    def support(self) -> Optional[str]:
-        """
+    support: Optional[:class:`str`]
         The support server invite code of the bot.
-        """
-        return self._data.get('support')
-
-    @property
-    def github(self) -> Optional[str]:
-        """
+    github: Optional[:class:`str`]
         The link to the github repo of the bot.
-        """
-        return self._data.get('github')
-
-    @cached_property
-    def owners(self) -> list[int]:
-        """
+    owners: list[:class:`int`]
         Snowflakes of the owners of the bot. First one in the list is the main owner.
-        """
-        return [int(owner) for owner in self._data['owners']]
-
-    @cached_property
-    def featured_guilds(self) -> list[int]:
-        """
+    featured_guilds: list[:class:`int`]
         Snowflakes of the guilds featured on the bot page.
-        """
-        return [int(guild) for guild in self._data['guilds']]
-
-    @property
-    def invite(self) -> Optional[str]:
-        """
+    invite: Optional[:class:`str`]
         The custom bot invite url of the bot.
-        """
-        return self._data.get('invite')
-
-    @property
-    def date_of_approval(self) -> datetime.datetime:
-        """
+    date_of_approval: Optional[:class:`datetime.datetime`]
         The date when the bot was approved.
-        """
-        return datetime.datetime.fromisoformat(self._data['date'])
-
-    @property
-    def guild_count(self) -> Optional[int]:
-        """
-        The amount of guilds the bot has according to posted stats..
-        """
-        return self._data.get('server_count')
-
-    @property
-    def shard_count(self) -> Optional[int]:
-        """
-        The amount of shards the bot has according to posted stats..
-        """
-        return self._data.get('shard_count')
-
-    @property
-    def certified(self) -> bool:
-        """
+    guild_count: Optional[:class:`int`]
+        The amount of guilds the bot has according to posted stats.
+    shard_count: Optional[:class:`int`]
+        The amount of shards the bot has according to posted stats.
+    certified: :class:`bool`
         The certified status of the bot.
-        """
-        return self._data['certifiedBot']
-
-    @property
-    def vanity(self) -> Optional[str]:
-        """
+    vanity: Optional[:class:`str`]
         The vanity url of the bot.
-        """
-        return self._data['vanity']
-
-    @property
-    def upvotes(self) -> int:
-        """
-        The amount of upvotes the bot has
-        """
-        return self._data['points']
-
-    @property
-    def monthly_upvotes(self) -> int:
-        """
+    upvotes: :class:`int`
+        The amount of upvotes the bot has.
+    monthly_upvotes: :class:`int`
         The amount of upvotes the bot has this month.
-        """
-        return self._data['monthlyPoints']
+    raw: Optional[:class:`dict`]
+        The data sent by Top.gg. ``None`` if ``keep_raw`` is False.
+
+        .. versionadded:: 2.1
+    """
+    __slots__ = (
+        'id',
+        'name',
+        'discriminator',
+        'avatar',
+        'prefix',
+        'short_description',
+        'long_description',
+        'tags',
+        'website',
+        'support',
+        'github',
+        'owners',
+        'featured_guilds',
+        'invite',
+        'date_of_approval',
+        'guild_count',
+        'shard_count',
+        'certified',
+        'vanity',
+        'upvotes',
+        'monthly_upvotes',
+        'raw'
+    )
+
+    def __init__(self, data: dict, *, keep_raw: bool = True) -> None:
+        self.id: int = int(data['id'])
+        self.name: str = data['username']
+        self.discriminator: int = int(data.get('discriminator') or 0)
+        self.avatar: Optional[str] = data.get('avatar') or data.get('defAvatar')
+        self.prefix: str = data.get('prefix')
+        self.short_description: str = data.get('shortdesc')
+        self.long_description: Optional[str] = data.get('longdesc')
+        self.tags: list[str] = data.get('tags', [])
+        self.website: Optional[str] = data.get('website')
+        self.support: Optional[str] = data.get('support')
+        self.github: Optional[str] = data.get('github')
+        self.owners: list[int] = [int(owner) for owner in data.get('owners', [])]
+        self.featured_guilds: list[int] = [int(guild) for guild in data.get('guilds', [])]
+        self.invite: Optional[str] = data.get('invite')
+        self.date_of_approval: Optional[datetime.datetime] = _parse_datetime(data.get('date'))
+        self.guild_count: Optional[int] = _parse_int(data.get('server_count'))
+        self.shard_count: Optional[int] = _parse_int(data.get('shard_count'))
+        self.certified: bool = data.get('certifiedBot', False)
+        self.vanity: Optional[str] = data.get('vanity')
+        self.upvotes: int = data.get('points', 0)
+        self.monthly_upvotes: int = data.get('monthlyPoints', 0)
+
+        self.raw: Optional[dict] = data if keep_raw else None
+
+    def __str__(self) -> str:
+        return f'{self.name}#{self.discriminator}'
 
 
 class TopGGUser(BaseModel):
@@ -379,31 +314,31 @@ class TopGGUser(BaseModel):
 
     .. versionchanged:: 2.0
         Renamed to `TopGGUser`
+
+    .. versionchanged:: 2.1
+        The data is parsed once when the user is created.
+
+    Attributes
+    -----------
+    id: :class:`int`
+        The id of the user.
+    name: :class:`str`
+        The username of the user.
+    avatar: Optional[:class:`str`]
+        The avatar of the user.
+    raw: Optional[:class:`dict`]
+        The data sent by Top.gg. ``None`` if ``keep_raw`` is False.
+
+        .. versionadded:: 2.1
     """
+    __slots__ = ('id', 'name', 'avatar', 'raw')
+
+    def __init__(self, data: dict, *, keep_raw: bool = True) -> None:
+        self.id: int = int(data['id'])
+        self.name: str = data['username']
+        self.avatar: Optional[str] = data.get('avatar')
 
-    def __init__(self, data: dict) -> None:
-        self._data = data
+        self.raw: Optional[dict] = data if keep_raw else None
 
     def __str__(self) -> str:
         return self.name
-
-    @property
-    def name(self) -> str:
-        """
-        The username of the user.
-        """
-        return self._data['str']
-
-    @property
-    def id(self) -> int:
-        """
-          The username of the user.
-        """
-        return int(self._data['id'])
-
-    @property
-    def avatar(self) -> str:
-        """
-        The avatar hash of the user's avatar
-        """
-        return self._data['avatar']
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from abc import abstractmethod
+from collections import deque
+from typing import Any, Deque, Optional, Protocol, runtime_checkable
+
+
+__all__ = (
+    'AbstractRateLimitBackend',
+    'MemoryRateLimitBackend',
+    'RateLimiter',
+    'SQLiteRateLimitBackend'
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class AbstractRateLimitBackend(Protocol):
+    """A protocol for storing the tokens of rate limit buckets.
+
+    Every method must be atomic for the processes sharing the backend.
+    ``rate`` and ``per`` are passed every time so buckets can be created lazily.
+
+    .. versionadded:: 2.1
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, rate: float, per: float) -> float:
+        """
+        Take a token from a bucket.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key of the bucket.
+        rate: :class:`float`
+            The amount of tokens refilled every ``per`` seconds. This is also the size of the bucket.
+        per: :class:`float`
+            The amount of seconds it takes to refill the bucket.
+
+        Returns
+        --------
+        :class:`float`
+            ``0`` if a token was taken, otherwise the amount of seconds until one is available.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, key: str, rate: float, per: float) -> None:
+        """
+        Give a token back to a bucket.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def cap(self, key: str, rate: float, per: float, tokens: float) -> None:
+        """
+        Lower the tokens of a bucket to ``tokens``. This can be negative to empty the bucket for longer.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def tokens(self, key: str, rate: float, per: float) -> float:
+        """
+        The amount of tokens currently in a bucket.
+        """
+        raise NotImplementedError
+
+
+def _refill(tokens: float, last_update: float, now: float, rate: float, per: float) -> float:
+    # the clock can go backwards, which must never take tokens away
+    return min(rate, tokens + max(0.0, now - last_update) * rate / per)
+
+
+class MemoryRateLimitBackend(AbstractRateLimitBackend):
+    """
+    Keeps buckets in the memory of the current process. This is the default.
+
+    .. versionadded:: 2.1
+    """
+    def __init__(self):
+        # key -> [tokens, last update]
+        self._buckets: dict[str, list[float]] = {}
+
+    def _get(self, key: str, rate: float, per: float) -> list[float]:
+        now = time.monotonic()
+
+        try:
+            bucket = self._buckets[key]
+        except KeyError:
+            bucket = self._buckets[key] = [rate, now]
+        else:
+            bucket[0] = _refill(bucket[0], bucket[1], now, rate, per)
+            bucket[1] = now
+
+        return bucket
+
+    def acquire(self, key: str, rate: float, per: float) -> float:
+        bucket = self._get(key, rate, per)
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0
+        return (1 - bucket[0]) * per / rate
+
+    def release(self, key: str, rate: float, per: float) -> None:
+        bucket = self._get(key, rate, per)
+        bucket[0] = min(rate, bucket[0] + 1)
+
+    def cap(self, key: str, rate: float, per: float, tokens: float) -> None:
+        bucket = self._get(key, rate, per)
+        bucket[0] = min(bucket[0], tokens)
+
+    def tokens(self, key: str, rate: float, per: float) -> float:
+        return self._get(key, rate, per)[0]
+
+
+class SQLiteRateLimitBackend(AbstractRateLimitBackend):
+    """
+    Keeps buckets in a SQLite file so every process on the same host shares the same budget.
+    This is useful for bots split over multiple shard processes using the same token.
+
+    Each operation is a short ``BEGIN IMMEDIATE`` transaction which locks the file for a few microseconds.
+    Operations run on the event loop, so the lock is only waited for briefly. A request that can't get it
+    waits ``busy_delay`` seconds and tries again instead of blocking the bot.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The path to the database file. Every process must use the same path.
+        Defaults to ``toppy_ratelimits.db``.
+    timeout: :class:`float`
+        How long to wait for another process to release the lock.
+        Defaults to 0.005.
+    busy_delay: :class:`float`
+        How long a request waits when the lock couldn't be taken in time.
+        Defaults to 0.01.
+    """
+    def __init__(self, path: str = 'toppy_ratelimits.db', *, timeout: float = 0.005, busy_delay: float = 0.01):
+        self.path = path
+        self.timeout = timeout
+        self.busy_delay = busy_delay
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: int = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # connections can't be shared with a forked process
+        if self._conn is None or self._pid != os.getpid():
+            _log.debug('Connecting to rate limit database %s', self.path)
+            # setting up waits longer since it only happens once
+            self._conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL;')
+            self._conn.execute(
+                '''CREATE TABLE IF NOT EXISTS buckets(
+                            key TEXT PRIMARY KEY,
+                            tokens REAL,
+                            last_update REAL
+                );'''
+            )
+            self._conn.execute(f'PRAGMA busy_timeout = {int(self.timeout * 1000)};')
+            self._pid = os.getpid()
+
+        return self._conn
+
+    def _transaction(self, key: str, rate: float, per: float, change, busy: Any = None) -> Any:
+        conn = self._connect()
+        # the monotonic clock restarts when the host reboots but the file stays
+        now = time.time()
+
+        try:
+            conn.execute('BEGIN IMMEDIATE;')
+        except sqlite3.OperationalError:
+            _log.debug('Rate limit database %s is locked by another process.', self.path)
+            return busy
+
+        try:
+            row = conn.execute('SELECT tokens, last_update FROM buckets WHERE key = ?;', (key,)).fetchone()
+            tokens = rate if row is None else _refill(row[0], row[1], now, rate, per)
+
+            tokens, ret = change(tokens)
+
+            conn.execute('INSERT OR REPLACE INTO buckets VALUES (?, ?, ?);', (key, tokens, now))
+        except BaseException:
+            conn.execute('ROLLBACK;')
+            raise
+        else:
+            conn.execute('COMMIT;')
+
+        return ret
+
+    def acquire(self, key: str, rate: float, per: float) -> float:
+        def change(tokens: float) -> tuple[float, float]:
+            if tokens >= 1:
+                return tokens - 1, 0
+            return tokens, (1 - tokens) * per / rate
+
+        return self._transaction(key, rate, per, change, busy=self.busy_delay)
+
+    def release(self, key: str, rate: float, per: float) -> None:
+        self._transaction(key, rate, per, lambda tokens: (min(rate, tokens + 1), 0))
+
+    def cap(self, key: str, rate: float, per: float, tokens: float) -> None:
+        self._transaction(key, rate, per, lambda current: (min(current, tokens), 0))
+
+    def tokens(self, key: str, rate: float, per: float) -> float:
+        return self._transaction(key, rate, per, lambda tokens: (tokens, tokens), busy=0.0)
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class RateLimiter:
+    """A token bucket that is safe to share between many coroutines.
+
+    ``rate`` tokens are refilled evenly over ``per`` seconds and the bucket can hold at most ``rate`` tokens,
+    so a burst of up to ``rate`` requests is let through immediately and the rest are spaced out.
+    Waiters are let through in FIFO order and only one waiter is woken up per available token.
+
+    The tokens are stored in ``backend`` under ``key`` so they can be shared with other processes.
+    """
+
+    def __init__(self, rate: float, per: float, *, key: str = 'default',
+                 backend: Optional[AbstractRateLimitBackend] = None):
+        self.rate = rate
+        self.per = per
+
+        self.key = key
+        self.backend: AbstractRateLimitBackend = backend or MemoryRateLimitBackend()
+
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # monotonic time before which nobody is let through, set by delay
+        self._not_before: float = 0.0
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} key={self.key!r} rate={self.rate} per={self.per} tokens={self.tokens:.2f}>'
+
+    @property
+    def tokens(self) -> float:
+        """The amount of tokens currently available."""
+        return self.backend.tokens(self.key, self.rate, self.per)
+
+    @property
+    def interval(self) -> float:
+        """The amount of seconds it takes to refill one token."""
+        return self.per / self.rate
+
+    def _acquire(self) -> float:
+        return self.backend.acquire(self.key, self.rate, self.per)
+
+    def _wake_waiters(self) -> None:
+        self._timer = None
+
+        held = self._not_before - time.monotonic()
+        if held > 0 and self._waiters:
+            self._timer = asyncio.get_running_loop().call_later(held, self._wake_waiters)
+            return
+
+        while self._waiters:
+            if self._waiters[0].done():  # cancelled while waiting
+                self._waiters.popleft()
+                continue
+
+            delay = self._acquire()
+            if delay:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._wake_waiters)
+                return
+
+            self._waiters.popleft().set_result(None)
+
+    def _reschedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._waiters:
+            self._wake_waiters()
+        else:
+            self._timer = None
+
+    def update(self, limit: Optional[float] = None, remaining: Optional[float] = None,
+               reset_after: Optional[float] = None, *, per: Optional[float] = None) -> None:
+        """Resize the bucket with the rate limit information sent by the site.
+
+        Parameters
+        -----------
+        limit: Optional[:class:`float`]
+            The amount of requests allowed per window.
+        remaining: Optional[:class:`float`]
+            The amount of requests left in the current window.
+        reset_after: Optional[:class:`float`]
+            The amount of seconds until the window resets.
+        per: Optional[:class:`float`]
+            The length of the window in seconds. The rate only changes when both ``limit`` and ``per`` are known
+            since changing one without the other changes how fast tokens are refilled.
+        """
+        if limit is not None and limit > 0:
+            if per is not None and per > 0:
+                self.rate = limit
+                self.per = per
+            self.backend.cap(self.key, self.rate, self.per, limit)
+        if remaining is not None:
+            # other requests may still be in flight so never give back tokens
+            self.backend.cap(self.key, self.rate, self.per, remaining)
+            if remaining < 1 and reset_after is not None:
+                self.delay(reset_after)
+                return
+
+        self._reschedule()
+
+    def delay(self, seconds: float) -> None:
+        """Hold every waiter for the next ``seconds`` seconds without taking their tokens."""
+        self._not_before = max(self._not_before, time.monotonic() + seconds)
+        self._reschedule()
+
+    async def block(self) -> None:
+        """Wait until a token is available and consume it."""
+        if not self._waiters and self._not_before <= time.monotonic() and not self._acquire():
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        if self._timer is None:
+            self._wake_waiters()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the token was handed to us but we can't use it anymore so give it to the next waiter
+                self.backend.release(self.key, self.rate, self.per)
+                self._reschedule()
+            raise
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Optional
+
+from .utils import from_json
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+__all__ = (
+    'JSONArrayParser',
+    'iter_json_array'
+)
+
+
+# the only bytes that change the state of the parser
+_SPECIAL = re.compile(rb'[\[\]{}",:]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_NON_WHITESPACE = re.compile(rb'\S')
+
+_QUOTE, _BACKSLASH, _COMMA, _COLON = b'"', b'\\', b',', b':'
+_OPENING, _CLOSING = b'[{', b']}'
+
+
+class JSONArrayParser:
+    """
+    Decodes the items of a JSON array as the document is received.
+
+    Only the bytes of the item currently being received are kept, so a large array never has to be
+    in memory as text and as objects at once.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    key: Optional[:class:`str`]
+        The key of the array in the top level object. Defaults to the document being the array.
+    loads: Optional[Callable[[:class:`bytes`], Any]]
+        The function to decode each item with.
+        Defaults to the codec set with :func:`toppy.utils.set_json_codec`.
+
+    Attributes
+    -----------
+    done: :class:`bool`
+        Whether the end of the array has been reached.
+    """
+    def __init__(self, key: Optional[str] = None, *, loads: Optional[Callable[[bytes], Any]] = None):
+        self.key = key
+        self.loads: Callable[[bytes], Any] = loads or from_json
+        self.done: bool = False
+
+        self._buf = bytearray()
+        self._pos: int = 0
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._string_start: int = 0
+        self._last_string: bytes = b''
+        # the top level array is found right away, a keyed one once its key is read
+        self._awaiting_array: bool = key is None
+        self._array_depth: Optional[int] = None
+        self._item_start: int = 0
+
+    def feed(self, data: bytes) -> list[Any]:
+        """
+        Parse the next part of the document.
+
+        Parameters
+        -----------
+        data: :class:`bytes`
+            The received bytes.
+
+        Raises
+        -------
+        ValueError
+            The array is not where it was expected.
+
+        Returns
+        --------
+        list[Any]
+            The items completed by this part.
+        """
+        if self.done:
+            return []
+
+        buf = self._buf
+        buf += data
+        items = []
+
+        while not self.done:
+            if self._awaiting_array:
+                match = _NON_WHITESPACE.search(buf, self._pos)
+                if match is None:
+                    self._pos = len(buf)
+                    break
+
+                if buf[match.start():match.end()] != b'[':
+                    raise ValueError(f'Expected a JSON array{f" under {self.key!r}" if self.key else ""}.')
+
+                self._awaiting_array = False
+                self._depth += 1
+                self._array_depth = self._depth
+                self._pos = self._item_start = match.end()
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, self._pos)
+                if match is None:
+                    self._pos = len(buf)
+                    break
+
+                if buf[match.start():match.end()] == _BACKSLASH:
+                    if match.end() >= len(buf):
+                        # the escaped byte hasn't been received yet
+                        self._pos = match.start()
+                        break
+                    self._pos = match.end() + 1
+                    continue
+
+                self._in_string = False
+                self._pos = match.end()
+                if self._array_depth is None:
+                    self._last_string = bytes(buf[self._string_start:match.start()])
+                continue
+
+            match = _SPECIAL.search(buf, self._pos)
+            if match is None:
+                self._pos = len(buf)
+                break
+
+            char = buf[match.start():match.end()]
+            self._pos = match.end()
+
+            if char == _QUOTE:
+                self._in_string = True
+                self._string_start = match.end()
+            elif char in _OPENING:
+                self._depth += 1
+            elif char in _CLOSING:
+                if self._depth == self._array_depth:
+                    item = bytes(buf[self._item_start:match.start()]).strip()
+                    if item:
+                        items.append(self.loads(item))
+                    self.done = True
+                self._depth -= 1
+            elif char == _COMMA:
+                if self._depth == self._array_depth:
+                    items.append(self.loads(bytes(buf[self._item_start:match.start()])))
+                    self._item_start = match.end()
+            elif char == _COLON:
+                if self._depth == 1 and self._array_depth is None and self._is_key(self._last_string):
+                    self._awaiting_array = True
+
+        self._compact()
+        return items
+
+    def _is_key(self, raw: bytes) -> bool:
+        return json.loads(b'"' + raw + b'"') == self.key
+
+    def _compact(self) -> None:
+        # drop everything that is no longer needed
+        if self._array_depth is not None and not self.done:
+            cut = self._item_start
+        elif self._in_string:
+            cut = self._string_start
+        else:
+            cut = self._pos
+
+        if cut:
+            del self._buf[:cut]
+            self._pos -= cut
+            self._item_start -= cut
+            self._string_start -= cut
+
+
+async def iter_json_array(content: aiohttp.StreamReader, key: Optional[str] = None, *,
+                          loads: Optional[Callable[[bytes], Any]] = None,
+                          chunk_size: int = 2 ** 16) -> AsyncGenerator[Any, None]:
+    """
+    Yield the items of a JSON array as the response body is received.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    content: :class:`aiohttp.StreamReader`
+        The body of the response.
+    key: Optional[:class:`str`]
+        The key of the array in the top level object. Defaults to the body being the array.
+    loads: Optional[Callable[[:class:`bytes`], Any]]
+        The function to decode each item with.
+    chunk_size: :class:`int`
+        The maximum amount of bytes to read at once.
+
+    Raises
+    -------
+    ValueError
+        The body ended before the array did or the array is not where it was expected.
+
+    Yields
+    -------
+    Any
+        The decoded items.
+    """
+    parser = JSONArrayParser(key, loads=loads)
+
+    async for chunk in content.iter_chunked(chunk_size):
+        for item in parser.feed(chunk):
+            yield item
+
+        if parser.done:
+            return
+
+    raise ValueError('The body ended before the JSON array did.')
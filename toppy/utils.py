@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generator, Generic, Optional, Type, TypeVar
+import importlib
+import importlib.util
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union
+)
 
 import aiohttp
 from aiohttp import web
@@ -10,8 +24,11 @@ if TYPE_CHECKING:
 
 
 __all__ = (
+    'JSONCodec',
     'MISSING',
-    'run_web_application'
+    'get_json_codec',
+    'run_web_application',
+    'set_json_codec'
 )
 
 
@@ -37,6 +54,99 @@ class _MissingSentinel:
 
 
 MISSING: Any = _MissingSentinel()
+
+
+class JSONCodec(NamedTuple):
+    """
+    The functions used to encode and decode JSON.
+
+    .. versionadded:: 2.1
+
+    Attributes
+    -----------
+    name: :class:`str`
+        The name of the library.
+    dumps: Callable[[Any], :class:`str`]
+        Encodes an object.
+    loads: Callable[[Union[:class:`str`, :class:`bytes`]], Any]
+        Decodes a document. Invalid documents raise :exc:`ValueError`.
+    """
+    name: str
+    dumps: Callable[[Any], str]
+    loads: Callable[[Union[str, bytes]], Any]
+
+
+def _create_json_codec(name: str) -> JSONCodec:
+    module = importlib.import_module(name)
+
+    if name == 'orjson':
+        return JSONCodec(name, lambda obj: module.dumps(obj).decode(), module.loads)
+    if name == 'msgspec':
+        return JSONCodec(name, lambda obj: module.json.encode(obj).decode(), module.json.decode)
+    if name in ('ujson', 'json'):
+        return JSONCodec(name, module.dumps, module.loads)
+
+    raise ValueError(f'Unknown JSON library {name!r}.')
+
+
+# the fastest first
+_JSON_LIBRARIES = ('orjson', 'msgspec', 'ujson', 'json')
+_json_codec: JSONCodec = MISSING
+
+
+def set_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Set the library used for JSON in requests, responses, webhooks and caches.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    name: Optional[:class:`str`]
+        One of ``orjson``, ``msgspec``, ``ujson`` or ``json``.
+        Defaults to the fastest one installed. This is used if this is never called.
+
+    Raises
+    -------
+    ImportError
+        The library isn't installed.
+
+    Returns
+    --------
+    :class:`JSONCodec`
+        The codec that is now used.
+    """
+    global _json_codec
+
+    if name is None:
+        name = next(library for library in _JSON_LIBRARIES if importlib.util.find_spec(library) is not None)
+
+    _json_codec = _create_json_codec(name)
+    return _json_codec
+
+
+def get_json_codec() -> JSONCodec:
+    """
+    Get the codec currently used for JSON.
+
+    .. versionadded:: 2.1
+
+    Returns
+    --------
+    :class:`JSONCodec`
+    """
+    return _json_codec
+
+
+def to_json(obj: Any) -> str:
+    return _json_codec.dumps(obj)
+
+
+def from_json(data: Union[str, bytes]) -> Any:
+    return _json_codec.loads(data)
+
+
+set_json_codec()
     
     
 class AsyncContextManager(Generic[T]):
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+from array import array
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from .errors import HTTPException
+from .models import TopGGUser
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    from .client import TopGGClient
+
+
+__all__ = (
+    'VoteSnapshot',
+    'VoteTracker'
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+def _find_new_votes(previous: array, current: array) -> int:
+    # both lists are newest first and capped so new votes push the oldest ones off the end
+    # the amount of new votes is the offset where the previous list continues in the current one
+    if not previous:
+        return len(current)
+
+    head = previous[0]
+
+    # scanned by hand since array.index only takes a start from Python 3.10
+    for offset, user_id in enumerate(current):
+        if user_id == head and current[offset:] == previous[:len(current) - offset]:
+            return offset
+
+    # no overlap, every vote is new such as when votes are reset at the start of the month
+    return len(current)
+
+
+class VoteSnapshot:
+    """
+    The last 1000 votes of a bot stored as columns instead of one :class:`TopGGUser` per vote.
+
+    IDs are kept in an ``array('Q')`` and names and avatars are interned, so a snapshot is small
+    and the helpers run over the columns without making any models.
+    Votes are ordered newest first like :meth:`TopGGClient.last_1000_votes`.
+
+    .. versionadded:: 2.1
+
+    Attributes
+    -----------
+    ids: :class:`array.array`
+        The IDs of the users for each vote.
+    names: list[:class:`str`]
+        The usernames of the users for each vote.
+    avatars: list[Optional[:class:`str`]]
+        The avatars of the users for each vote.
+    """
+    __slots__ = ('ids', 'names', 'avatars', '_voters')
+
+    def __init__(self, ids: Optional[array] = None, names: Optional[list[str]] = None,
+                 avatars: Optional[list[Optional[str]]] = None):
+        self.ids: array = ids if ids is not None else array('Q')
+        self.names: list[str] = names if names is not None else []
+        self.avatars: list[Optional[str]] = avatars if avatars is not None else []
+        self._voters: Optional[frozenset[int]] = None
+
+    @classmethod
+    def from_data(cls, data: Iterable[dict[str, Any]]) -> VoteSnapshot:
+        """
+        Make a snapshot from the votes returned by Top.gg.
+
+        Parameters
+        -----------
+        data: Iterable[:class:`dict`]
+            The votes.
+
+        Returns
+        --------
+        :class:`VoteSnapshot`
+        """
+        snapshot = cls()
+        for user in data:
+            snapshot._append(user)
+        return snapshot
+
+    def _append(self, user: dict[str, Any]) -> None:
+        avatar = user.get('avatar')
+
+        self.ids.append(int(user['id']))
+        self.names.append(sys.intern(user['username']))
+        self.avatars.append(sys.intern(avatar) if avatar is not None else None)
+        self._voters = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} votes={len(self)} voters={len(self.voters)}>'
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.voters
+
+    def __iter__(self) -> Iterator[TopGGUser]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> TopGGUser:
+        return TopGGUser(
+            {'id': self.ids[index], 'username': self.names[index], 'avatar': self.avatars[index]},
+            keep_raw=False
+        )
+
+    @property
+    def voters(self) -> frozenset[int]:
+        """
+        The IDs of every user who voted. Only made once.
+
+        Returns
+        --------
+        frozenset[:class:`int`]
+        """
+        if self._voters is None:
+            self._voters = frozenset(self.ids)
+        return self._voters
+
+    def has_voted(self, user_ids: Iterable[int]) -> dict[int, bool]:
+        """
+        Check which users are in the snapshot.
+
+        Parameters
+        -----------
+        user_ids: Iterable[:class:`int`]
+            The IDs of the users.
+
+        Returns
+        --------
+        dict[:class:`int`, :class:`bool`]
+        """
+        voters = self.voters
+        return {user_id: user_id in voters for user_id in user_ids}
+
+    def diff(self, previous: VoteSnapshot) -> VoteSnapshot:
+        """
+        Get the votes made since an older snapshot.
+
+        Parameters
+        -----------
+        previous: :class:`VoteSnapshot`
+            The older snapshot.
+
+        Returns
+        --------
+        :class:`VoteSnapshot`
+            The new votes, newest first.
+        """
+        new = _find_new_votes(previous.ids, self.ids)
+        return VoteSnapshot(self.ids[:new], self.names[:new], self.avatars[:new])
+
+    def counts(self) -> Counter[int]:
+        """
+        Count the votes of each user.
+
+        Returns
+        --------
+        :class:`collections.Counter`
+            The user IDs mapped to their amount of votes.
+        """
+        return Counter(self.ids)
+
+    def top_voters(self, n: Optional[int] = None) -> list[tuple[int, int]]:
+        """
+        Get the users who voted the most.
+
+        Parameters
+        -----------
+        n: Optional[:class:`int`]
+            The amount of users to get. Defaults to every user.
+
+        Returns
+        --------
+        list[tuple[:class:`int`, :class:`int`]]
+            The user IDs and their amount of votes, most votes first.
+        """
+        return self.counts().most_common(n)
+
+
+class VoteTracker:
+    """
+    Polls :meth:`TopGGClient.last_1000_votes` and dispatches ``topgg_poll_vote`` for every new vote.
+    This can be used as a fallback when the webhook server is down.
+
+    Only a :class:`VoteSnapshot` of the last poll is kept and models are only made for new votes.
+    Nothing is dispatched for the votes found by the first poll.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    client: :class:`TopGGClient`
+        The client to poll with.
+    interval: :class:`float`
+        The interval in seconds to poll at.
+        Defaults to 60.
+    bot_id: Optional[:class:`int`]
+        The ID of the bot.
+        Defaults to the Bot initialized with.
+    """
+    def __init__(self, client: TopGGClient, *, interval: float = 60, bot_id: Optional[int] = None):
+        self.client = client
+        self.interval = interval
+        self.bot_id = bot_id
+
+        self.snapshot: Optional[VoteSnapshot] = None
+        self.__task: asyncio.Task = MISSING
+
+    @property
+    def task(self) -> asyncio.Task:
+        """
+        The :class:`asyncio.Task` object for polling.
+        """
+        return self.__task
+
+    def start(self) -> None:
+        """Starts the polling task."""
+        self.__task = self.client.client.loop.create_task(self._poll_task(), name='topgg_vote_tracker')
+
+    def cancel(self) -> None:
+        """Cancels the polling task."""
+        self.task.cancel()
+
+    async def poll(self) -> list[TopGGUser]:
+        """
+        Poll the votes once and dispatch ``topgg_poll_vote`` for the new ones.
+
+        Returns
+        --------
+        list[:class:`TopGGUser`]
+            The users who voted since the last poll, oldest first.
+        """
+        bot_id = self.bot_id or self.client._get_bot_id()
+
+        data: list[dict[str, Any]] = await self.client.http.last_1000_votes(bot_id)
+        current = VoteSnapshot.from_data(data)
+
+        previous, self.snapshot = self.snapshot, current
+        if previous is None:
+            _log.debug('Found %d votes on the first poll.', len(current))
+            return []
+
+        new = len(current.diff(previous))
+        users = [TopGGUser(user, keep_raw=self.client.keep_raw) for user in reversed(data[:new])]
+
+        for user in users:
+            self.client.client.dispatch('topgg_poll_vote', user)
+
+        _log.debug('Found %d new votes.', new)
+        return users
+
+    async def _poll_task(self) -> None:
+        await self.client.client.wait_until_ready()
+        while not self.client.client.is_closed():
+            try:
+                await self.poll()
+            except HTTPException as exc:
+                self.client.client.dispatch('topgg_poll_error', exc)
+            await asyncio.sleep(self.interval)
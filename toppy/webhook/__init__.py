@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
-from typing import TYPE_CHECKING, Optional, Type
+from typing import TYPE_CHECKING, Iterable, Optional, Type, Union
 
 from aiohttp import web
 
+from .auth import WebhookAuth
 from .cache import AbstractDatabase, CachedVote, JSONDatabase, SQLiteDatabase
+from .dedup import VoteDeduplicator
+from .limits import WebhookLimits
 from .payload import DiscordBotListVotePayload, TopGGVotePayload
+from .queue import VoteQueue
+from .routes import _add_vote_routes, _vote_processor
+from .workers import WebhookWorkers
 from ..utils import MISSING
 
 if TYPE_CHECKING:
@@ -17,7 +22,13 @@ if TYPE_CHECKING:
 
 __all__ = (
     'create_webhook_server',
+    'VoteDeduplicator',
+    'VoteQueue',
+    'WebhookAuth',
+    'WebhookLimits',
+    'WebhookWorkers',
     # payloads
+    'DiscordBotListVotePayload',
     'TopGGVotePayload',
     # databases
     'AbstractDatabase',
@@ -33,12 +44,15 @@ _log = logging.getLogger(__name__)
 def create_webhook_server(
         client: ClientProtocol,
         *,
-        dbl_auth: Optional[str] = MISSING,
+        dbl_auth: Union[None, str, Iterable[str], WebhookAuth] = MISSING,
         dbgg_auth: Optional[str] = MISSING,
-        topgg_auth: Optional[str] = MISSING,
+        topgg_auth: Union[None, str, Iterable[str], WebhookAuth] = MISSING,
         web_app_class: Type[web.Application] = web.Application,
         application: Optional[web.Application] = None,
         db: Optional[AbstractDatabase] = None,
+        queue: Optional[VoteQueue] = None,
+        dedup: Optional[VoteDeduplicator] = None,
+        limits: Union[None, WebhookLimits, dict[str, WebhookLimits]] = None,
         **kwargs
 ) -> web.Application:
     """
@@ -52,12 +66,20 @@ def create_webhook_server(
     client: :class:`ClientProtocol`
         The Discord Bot instance. Any Client derived from ``discord.Client`` or any other fork's `Client`.
         It must fit the :class:`ClientProtocol`.
-    dbl_auth: Optional[:class:`str`]
+    dbl_auth: Union[None, :class:`str`, Iterable[:class:`str`], :class:`WebhookAuth`]
         The Discord Bot List webhook secret. This can be made in the bot's edit section.
+        Several secrets can be accepted while the secret is being changed.
+
+        .. versionchanged:: 2.1
+            Accepts several secrets and a :class:`WebhookAuth`.
     dbgg_auth: Optional[:class:`str`]
         The DiscordBotGG webhook secret. This can be found in the bots vote settings section.
-    topgg_auth: Optional[:class:`str`]
+    topgg_auth: Union[None, :class:`str`, Iterable[:class:`str`], :class:`WebhookAuth`]
         The Authorization for the webhook. You can make this in the webhooks section of the bot's edit section.
+        Several secrets can be accepted while the secret is being changed.
+
+        .. versionchanged:: 2.1
+            Accepts several secrets and a :class:`WebhookAuth`.
     web_app_class: Type[:class:`aiohttp.web.Application`]
         The web application class to use. Must be derived from :class:`aiohttp.web.Application`.
         If combined with `application` this will be ignored.
@@ -65,6 +87,20 @@ def create_webhook_server(
         A pre-existing application to use.
     db: Optional[:class:`AbstractDatabase`]
         The instance of a database. Must fit the :class:`AbstractDatabase` protocol.
+    queue: Optional[:class:`VoteQueue`]
+        The queue votes wait in to be dispatched and inserted into ``db``.
+        Defaults to a :class:`VoteQueue` with the default options.
+
+        .. versionadded:: 2.1
+    dedup: Optional[:class:`VoteDeduplicator`]
+        Used to respond to votes sent again without handling them again.
+
+        .. versionadded:: 2.1
+    limits: Union[None, :class:`WebhookLimits`, dict[:class:`str`, :class:`WebhookLimits`]]
+        The limits of every route or of each route by name, ``dbl`` or ``topgg``.
+        Defaults to a :class:`WebhookLimits` with the default options.
+
+        .. versionadded:: 2.1
     **kwargs:
         Keyword arguments to pass onto `web_app_class`.
 
@@ -76,6 +112,9 @@ def create_webhook_server(
 
     .. versionadded:: 1.5
         There are now options for a cache.
+
+    .. versionchanged:: 2.1
+        Votes are queued and the response is sent before the vote is dispatched.
     """
     if dbl_auth is MISSING:
         dbl_auth = os.urandom(16).hex()
@@ -84,51 +123,22 @@ def create_webhook_server(
     if topgg_auth is MISSING:
         topgg_auth = os.urandom(16).hex()
 
-    routes = web.RouteTableDef()
-
-    @routes.post('/dbl')
-    async def dbl_votes(request: web.Request) -> web.Response:
-        if dbl_auth is not None:
-            if request.headers.get('Authorization') != dbl_auth:
-                return web.Response(status=401)
-
-        try:
-            data = await request.json()
-        except json.JSONDecodeError:
-            return web.Response(status=400)
-
-        payload = TopGGVotePayload(client, data)
-        client.dispatch('dbl_vote', payload)
-
-        if db:
-            await db.insert(payload)
-
-        return web.Response(status=200, body=__package__)
-
-    @routes.post('/topgg')
-    async def topgg_votes(request: web.Request) -> web.Response:
-        if topgg_auth is not None:
-            if request.headers.get('Authorization') != topgg_auth:
-                return web.Response(status=401)
-
-        try:
-            data = await request.json()
-        except json.JSONDecodeError:
-            return web.Response(status=400)
-
-        payload = TopGGVotePayload(client, data)
-        client.dispatch('topgg_vote', payload)
-
-        if db:
-            await db.insert(payload)
-
-        return web.Response(status=200, body=__package__)
+    if queue is None:
+        queue = VoteQueue()
 
     if not application:
         app = web_app_class(**kwargs)
     else:
         app = application
 
-    app.add_routes(routes)
+    _add_vote_routes(
+        app,
+        client,
+        {'dbl': dbl_auth, 'topgg': topgg_auth},
+        queue=queue,
+        process=_vote_processor(client, db),
+        dedup=dedup,
+        limits=limits
+    )
 
     return app
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hmac
+from typing import Iterable, Optional, Union
+
+
+__all__ = (
+    'WebhookAuth',
+)
+
+
+class WebhookAuth:
+    """
+    The secrets accepted in the ``Authorization`` header of a webhook route.
+
+    Several secrets can be accepted at once so a secret can be changed without rejecting votes.
+    Add the new secret, change it on the site, then remove the old one. Changes apply right away.
+
+    Secrets are compared in constant time so the time taken doesn't reveal how much of a secret was guessed.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    *secrets: :class:`str`
+        The secrets to accept.
+
+    Example
+    ----------
+    .. code:: py
+
+        auth = toppy.webhook.WebhookAuth(old_secret)
+        app = toppy.webhook.create_webhook_server(bot, topgg_auth=auth)
+
+        # later
+        auth.add(new_secret)
+        # once the new secret is set on Top.gg
+        auth.remove(old_secret)
+    """
+    __slots__ = ('_secrets',)
+
+    def __init__(self, *secrets: str):
+        # encoded once instead of on every request
+        self._secrets: tuple[bytes, ...] = tuple(self._encode(secret) for secret in secrets)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} secrets={len(self._secrets)}>'
+
+    def __len__(self) -> int:
+        return len(self._secrets)
+
+    @staticmethod
+    def _encode(secret: str) -> bytes:
+        return secret.encode('utf-8', 'surrogateescape')
+
+    @property
+    def secrets(self) -> list[str]:
+        """
+        The accepted secrets.
+
+        Returns
+        --------
+        list[:class:`str`]
+        """
+        return [secret.decode('utf-8', 'surrogateescape') for secret in self._secrets]
+
+    def add(self, secret: str) -> None:
+        """
+        Start accepting a secret.
+
+        Parameters
+        -----------
+        secret: :class:`str`
+            The secret.
+        """
+        encoded = self._encode(secret)
+        if encoded not in self._secrets:
+            self._secrets += (encoded,)
+
+    def remove(self, secret: str) -> None:
+        """
+        Stop accepting a secret.
+
+        Parameters
+        -----------
+        secret: :class:`str`
+            The secret.
+        """
+        encoded = self._encode(secret)
+        self._secrets = tuple(existing for existing in self._secrets if existing != encoded)
+
+    def check(self, header: Optional[str]) -> bool:
+        """
+        Check an ``Authorization`` header.
+
+        Parameters
+        -----------
+        header: Optional[:class:`str`]
+            The value of the header. ``None`` if it is missing.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the header is one of the secrets.
+        """
+        if header is None:
+            return False
+
+        encoded = self._encode(header)
+        matched = False
+        # every secret is compared so the time doesn't depend on which one matched
+        for secret in self._secrets:
+            matched |= hmac.compare_digest(secret, encoded)
+        return matched
+
+
+def _resolve_auth(auth: Union[None, str, Iterable[str], WebhookAuth]) -> Optional[WebhookAuth]:
+    if auth is None or isinstance(auth, WebhookAuth):
+        return auth
+    if isinstance(auth, str):
+        return WebhookAuth(auth)
+    return WebhookAuth(*auth)
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import datetime
 import logging
-import json
 import os
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, Protocol, runtime_checkable
 
 from ..errors import MissingExtraRequire
-from ..utils import copy_doc, MISSING
+from ..utils import copy_doc, from_json, to_json, MISSING
 
 try:
     import aiosqlite
@@ -70,11 +69,16 @@ class CachedVote:
         The time the user voted at.
     site: :class:`str`
         The site the user voted on.
+    type: Optional[:class:`str`]
+        The type of the vote on Top.gg, ``upvote`` or ``test``. ``None`` for other sites and older votes.
+
+        .. versionadded:: 2.1
     """
     number: int
     id: int
     time: datetime.datetime
     site: str
+    type: Optional[str] = None
 
 
 @runtime_checkable
@@ -118,11 +122,33 @@ class AbstractDatabase(Protocol):
         """
         self.number += 1
 
-        async with aiofiles.open('toppy_vote_cache/number.txt') as f:
+        async with aiofiles.open('toppy_vote_cache/number.txt', 'w') as f:
             await f.write(str(self.number))
 
         _log.debug('Inserted vote into database with data %s', payload.raw)
 
+    async def fetch_since(self, since: datetime.datetime, *, site: Optional[str] = None) -> list[CachedVote]:
+        """
+        Fetch the votes made since a time without loading the older votes where possible.
+
+        .. versionadded:: 2.1
+
+        Parameters
+        ------------
+        since: :class:`datetime.datetime`
+            The earliest time of the votes to fetch.
+        site: Optional[:class:`str`]
+            Only fetch votes from this site, such as ``Top.gg``.
+
+        Returns
+        --------
+        list[:class:`CachedVote`]
+        """
+        return [
+            vote for vote in await self.fetchmany()
+            if vote.time >= since and (site is None or vote.site == site)
+        ]
+
     @abstractmethod
     async def fetchone(self, number: int) -> Optional[CachedVote]:
         """
@@ -172,22 +198,32 @@ class SQLiteDatabase(AbstractDatabase):
                         number INT PRIMARY KEY,
                         user_id INT,
                         time TEXT,
-                        site TEXT
+                        site TEXT,
+                        type TEXT
             );'''
         )
+
+        # tables made before 2.1 don't have the type of the vote
+        async with self.conn.execute('''PRAGMA table_info(votes);''') as cursor:
+            columns = [row[1] async for row in cursor]
+        if 'type' not in columns:
+            await self.conn.execute('''ALTER TABLE votes ADD COLUMN type TEXT;''')
+
+        await self.conn.execute('''CREATE INDEX IF NOT EXISTS votes_site_time ON votes(site, time);''')
         await self.conn.commit()
 
     @copy_doc(AbstractDatabase.insert)
     async def insert(self, payload: BaseVotePayload) -> None:
         await self.conn.execute(
-            '''INSERT INTO votes VALUES (
-                        ?, ?, ?, ?
+            '''INSERT INTO votes (number, user_id, time, site, type) VALUES (
+                        ?, ?, ?, ?, ?
             );''',
             (
                 self.number,
                 payload.user_id,
                 payload.time.isoformat(),
-                payload.SITE
+                payload.SITE,
+                getattr(payload, 'type', None)
             )
         )
         await self.conn.commit()
@@ -208,30 +244,46 @@ class SQLiteDatabase(AbstractDatabase):
         Optional[:class:`CachedVote`]
         """
         async with self.conn.execute(
-                '''SELECT * FROM votes WHERE number = ?;''',
+                '''SELECT number, user_id, time, site, type FROM votes WHERE number = ?;''',
                 (number,)
         ) as cursor:
             data = await cursor.fetchone()
 
             if not data:
                 return None
-            number, id, time, site = data
+            number, id, time, site, type = data
 
         return CachedVote(
             number,
             id,
             datetime.datetime.fromisoformat(time),
-            site
+            site,
+            type
         )
 
     @copy_doc(AbstractDatabase.fetchmany)
     async def fetchmany(self) -> list[CachedVote]:
         async with self.conn.execute(
-            '''SELECT * FROM votes;'''
+            '''SELECT number, user_id, time, site, type FROM votes;'''
         ) as cursor:
             return [
-                CachedVote(number, id, datetime.datetime.fromisoformat(time), site)
-                async for number, id, time, site in cursor
+                CachedVote(number, id, datetime.datetime.fromisoformat(time), site, type)
+                async for number, id, time, site, type in cursor
+            ]
+
+    @copy_doc(AbstractDatabase.fetch_since)
+    async def fetch_since(self, since: datetime.datetime, *, site: Optional[str] = None) -> list[CachedVote]:
+        # times are stored as ISO 8601 so they sort as text
+        query = '''SELECT number, user_id, time, site, type FROM votes WHERE time >= ?'''
+        params: tuple = (since.isoformat(),)
+        if site is not None:
+            query += ''' AND site = ?'''
+            params += (site,)
+
+        async with self.conn.execute(query + ';', params) as cursor:
+            return [
+                CachedVote(number, id, datetime.datetime.fromisoformat(time), site, type)
+                async for number, id, time, site, type in cursor
             ]
 
 
@@ -251,24 +303,24 @@ class JSONDatabase(AbstractDatabase):
 
         if not os.path.exists('toppy_vote_cache/votes.json'):
             async with aiofiles.open('toppy_vote_cache/votes.json', 'w') as f:
-                await f.write(json.dumps([]))
+                await f.write(to_json([]))
 
     @copy_doc(AbstractDatabase.insert)
     async def insert(self, payload: BaseVotePayload) -> None:
         async with aiofiles.open('toppy_vote_cache/votes.json', 'r') as f:
             text = await f.read()
 
-        data: list = json.loads(text)
+        data: list = from_json(text)
         data.append([
             self.number,
             payload.user_id,
             payload.time.isoformat(),
-            payload.SITE
+            payload.SITE,
+            getattr(payload, 'type', None)
         ])
 
         async with aiofiles.open('toppy_vote_cache/votes.json', 'w') as f:
-            dumped = json.dumps(text, indent=4)
-            await f.write(dumped)
+            await f.write(to_json(data))
 
         await super().insert(payload)
 
@@ -288,23 +340,43 @@ class JSONDatabase(AbstractDatabase):
         async with aiofiles.open('toppy_vote_cache/votes.json', 'r') as f:
             text = await f.read()
 
-        data: list = json.loads(text)[number]
+        data: list = from_json(text)[number]
 
-        return CachedVote(
-            data[0],
-            data[1],
-            datetime.datetime.fromisoformat(data[2]),
-            data[3]
-        )
+        return _load_json_vote(data)
 
     @copy_doc(AbstractDatabase.fetchmany)
     async def fetchmany(self) -> list[CachedVote]:
         async with aiofiles.open('toppy_vote_cache/votes.json', 'r') as f:
             text = await f.read()
 
-        data: list = json.loads(text)
+        data: list = from_json(text)
 
-        return [
-            CachedVote(d[0], d[1], datetime.datetime.fromisoformat(d[2]), d[3])
-            for d in data
-        ]
+        return [_load_json_vote(d) for d in data]
+
+    @copy_doc(AbstractDatabase.fetch_since)
+    async def fetch_since(self, since: datetime.datetime, *, site: Optional[str] = None) -> list[CachedVote]:
+        async with aiofiles.open('toppy_vote_cache/votes.json', 'r') as f:
+            text = await f.read()
+
+        votes = []
+        # votes are appended in order so only the newest have to be made into votes
+        for d in reversed(from_json(text)):
+            vote = _load_json_vote(d)
+            if vote.time < since:
+                break
+            if site is None or vote.site == site:
+                votes.append(vote)
+
+        votes.reverse()
+        return votes
+
+
+def _load_json_vote(data: list) -> CachedVote:
+    # votes from before 2.1 don't have a type
+    return CachedVote(
+        data[0],
+        data[1],
+        datetime.datetime.fromisoformat(data[2]),
+        data[3],
+        data[4] if len(data) > 4 else None
+    )
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Literal, Optional
+
+from .payload import TopGGVotePayload
+from ..utils import from_json, to_json
+
+if TYPE_CHECKING:
+    from .payload import BaseVotePayload
+
+
+__all__ = (
+    'VoteDeduplicator',
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class VoteDeduplicator:
+    """
+    Remembers recent webhook votes so a vote sent again by the site is only handled once.
+
+    Sites send a vote again when the response is slow or fails. Without this every retry is dispatched
+    and inserted into the database as a new vote.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    window: :class:`float`
+        The amount of seconds a vote is remembered for.
+        Defaults to 3600.
+    maxsize: :class:`int`
+        The maximum amount of votes remembered. The oldest are forgotten first.
+        Defaults to 100000.
+    by: Literal['vote', 'body']
+        ``vote`` treats votes from the same user for the same bot on the same site in the same ``bucket``
+        as duplicates. Votes without a user are compared by their body.
+        ``body`` treats requests with the exact same body as duplicates.
+        Defaults to ``vote``.
+    bucket: :class:`float`
+        The length in seconds of the time buckets votes are grouped in with ``by='vote'``. Users can vote again
+        after 12 hours on both sites so a new vote is never in the same bucket as the last one, however long
+        ``window`` is. A retry sent across the edge of a bucket is handled as a new vote.
+        Defaults to 43200.
+    path: Optional[:class:`str`]
+        A JSON file to keep the remembered votes in between restarts.
+
+    Attributes
+    -----------
+    duplicates: :class:`int`
+        The amount of duplicate votes found.
+    """
+    def __init__(self, window: float = 3600, *, maxsize: int = 100_000, by: Literal['vote', 'body'] = 'vote',
+                 bucket: float = 43200, path: Optional[str] = None):
+        if by not in ('vote', 'body'):
+            raise ValueError(f'by must be vote or body, not {by!r}')
+
+        self.window = window
+        self.maxsize = maxsize
+        self.by = by
+        self.bucket = bucket
+        self.path = path
+
+        self.duplicates: int = 0
+
+        # key -> time it expires, in order of expiry since the window never changes
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} size={len(self)} window={self.window} by={self.by!r}>'
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def key(self, site: str, payload: BaseVotePayload, body: bytes) -> str:
+        """
+        Get the key a vote is remembered by.
+
+        Parameters
+        -----------
+        site: :class:`str`
+            The site the vote is from.
+        payload: :class:`BaseVotePayload`
+            The vote.
+        body: :class:`bytes`
+            The body of the request.
+
+        Returns
+        --------
+        :class:`str`
+        """
+        if self.by == 'vote':
+            try:
+                user_id = payload.user_id
+                bot_id = payload.bot_id if isinstance(payload, TopGGVotePayload) else None
+            except (KeyError, TypeError, ValueError):
+                # without the IDs every such vote would share one key, so only identical bodies are duplicates
+                pass
+            else:
+                return f'{site}:{user_id}:{bot_id}:{int(payload.time.timestamp() // self.bucket)}'
+
+        return f'{site}:{hashlib.sha256(body).hexdigest()}'
+
+    def add(self, key: str) -> bool:
+        """
+        Remember a vote.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key from :meth:`key`.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the vote is new. ``False`` if it is a duplicate.
+        """
+        now = time.time()
+        self._expire(now)
+
+        if key in self._seen:
+            self.duplicates += 1
+            return False
+
+        self._seen[key] = now + self.window
+        if len(self._seen) > self.maxsize:
+            self._seen.popitem(last=False)
+        return True
+
+    def discard(self, key: str) -> None:
+        """
+        Forget a vote so it is handled if it is sent again. Used when a vote could not be queued.
+
+        Parameters
+        -----------
+        key: :class:`str`
+            The key from :meth:`key`.
+        """
+        self._seen.pop(key, None)
+
+    def load(self) -> None:
+        """
+        Load the votes saved to :attr:`path`. This is done by the webhook server when it starts.
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'rb') as file:
+                data = from_json(file.read())
+        except (OSError, ValueError) as exc:
+            _log.warning(f'Loading votes from `{self.path}` failed with an exception {exc.__class__.__name__!r}.')
+            return
+
+        now = time.time()
+        for key, expires in sorted(data.items(), key=lambda item: item[1]):
+            if expires > now:
+                self._seen[key] = expires
+        while len(self._seen) > self.maxsize:
+            self._seen.popitem(last=False)
+
+    def save(self) -> None:
+        """
+        Save the remembered votes to :attr:`path`. This is done by the webhook server when it stops.
+        """
+        if self.path is None:
+            return
+
+        self._expire(time.time())
+        with open(self.path, 'w') as file:
+            file.write(to_json(dict(self._seen)))
+
+    def _expire(self, now: float) -> None:
+        seen = self._seen
+        while seen:
+            key, expires = next(iter(seen.items()))
+            if expires > now:
+                break
+            del seen[key]
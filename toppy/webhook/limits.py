@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import Iterable, Optional, Union
+
+from aiohttp import web
+
+
+__all__ = (
+    'WebhookLimits',
+)
+
+
+class WebhookLimits:
+    """
+    Limits on the requests a webhook route accepts so large, slow or unexpected requests are rejected early.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    max_body_size: :class:`int`
+        The maximum amount of bytes of a body. Votes are a few hundred bytes.
+        Defaults to 16384.
+    read_timeout: Optional[:class:`float`]
+        The maximum amount of seconds to receive the body in. ``None`` to wait forever.
+        Defaults to 10.
+    content_types: Optional[Iterable[:class:`str`]]
+        The accepted ``Content-Type`` headers. ``None`` to accept any.
+        Defaults to ``application/json``.
+
+    Attributes
+    -----------
+    rejected: :class:`collections.Counter`
+        The amount of rejected requests by reason. The reasons are ``unauthorized``, ``content_type``,
+        ``too_large``, ``timeout``, ``invalid_body`` and ``queue_full``.
+    """
+    def __init__(self, max_body_size: int = 2 ** 14, *, read_timeout: Optional[float] = 10,
+                 content_types: Optional[Iterable[str]] = ('application/json',)):
+        self.max_body_size = max_body_size
+        self.read_timeout = read_timeout
+        self.content_types: Optional[frozenset[str]] = (
+            frozenset(content_types) if content_types is not None else None
+        )
+
+        self.rejected: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} max_body_size={self.max_body_size} read_timeout={self.read_timeout} '
+            f'rejected={sum(self.rejected.values())}>'
+        )
+
+    def reject(self, reason: str, status: int) -> web.Response:
+        """
+        Count a rejected request and make the response for it.
+
+        Parameters
+        -----------
+        reason: :class:`str`
+            The reason the request was rejected.
+        status: :class:`int`
+            The status to respond with.
+
+        Returns
+        --------
+        :class:`aiohttp.web.Response`
+        """
+        self.rejected[reason] += 1
+        return web.Response(status=status)
+
+    async def read(self, request: web.Request) -> Union[bytes, web.Response]:
+        """
+        Check the headers of a request and read its body within the limits.
+
+        Parameters
+        -----------
+        request: :class:`aiohttp.web.Request`
+            The request.
+
+        Returns
+        --------
+        Union[:class:`bytes`, :class:`aiohttp.web.Response`]
+            The body or the response to reject the request with.
+        """
+        if self.content_types is not None and request.content_type not in self.content_types:
+            return self.reject('content_type', 415)
+
+        # rejected before anything is read when the size is known up front
+        if request.content_length is not None and request.content_length > self.max_body_size:
+            return self.reject('too_large', 413)
+
+        try:
+            body = await asyncio.wait_for(self._read_body(request), self.read_timeout)
+        except asyncio.TimeoutError:
+            return self.reject('timeout', 408)
+
+        if body is None:
+            return self.reject('too_large', 413)
+        return body
+
+    async def _read_body(self, request: web.Request) -> Optional[bytes]:
+        body = bytearray()
+        async for chunk in request.content.iter_any():
+            body += chunk
+            if len(body) > self.max_body_size:
+                return None
+        return bytes(body)
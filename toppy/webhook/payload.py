@@ -18,11 +18,11 @@ class BaseVotePayload:
     SITE: ClassVar[str]
 
     def __init__(self, client: ClientProtocol, data: dict):
-        self.__client = client
-        self.__data = data
-        self.__time = datetime.datetime.now()
+        self._client = client
+        self._data = data
+        self._time = datetime.datetime.now()
 
-        self.__user: Optional[Snowflake] = None
+        self._user: Optional[Snowflake] = None
 
     @property
     def raw(self) -> dict:
@@ -33,7 +33,7 @@ class BaseVotePayload:
         --------
         :class:`dict`
         """
-        return self.__data
+        return self._data
 
     @property
     def time(self) -> datetime.datetime:
@@ -44,7 +44,7 @@ class BaseVotePayload:
         --------
         :class:`datetime.datetime`
         """
-        return self.__time
+        return self._time
 
     @property
     def user_id(self) -> int:
@@ -55,7 +55,7 @@ class BaseVotePayload:
         --------
         :class:`int`
         """
-        return int(self.__data['user'])
+        return int(self._data['user'])
 
     @property
     def user(self) -> Optional[Snowflake]:
@@ -67,13 +67,13 @@ class BaseVotePayload:
         --------
         Optional[:class:`Snowflake`]
         """
-        return self.__user or self.__client.get_user(self.user_id)
+        return self._user or self._client.get_user(self.user_id)
 
     async def fetch(self) -> None:
         """
         Fetches the user id from the Discord API to ensure `user` is not ``None``.
         """
-        self.__user = await self.__client.fetch_user(self.user_id)
+        self._user = await self._client.fetch_user(self.user_id)
 
 
 # the following documentation has been pulled from the Discord Bot List and Top.gg documentation
@@ -95,7 +95,7 @@ class DiscordBotListVotePayload(BaseVotePayload):
         --------
         :class:`bool`
         """
-        return self.__data['admin']
+        return self._data['admin']
 
     @property
     def avatar(self) -> str:
@@ -106,7 +106,7 @@ class DiscordBotListVotePayload(BaseVotePayload):
         --------
         :class:`str`
         """
-        return self.__data['admin']
+        return self._data['avatar']
 
     @property
     def username(self) -> str:
@@ -117,7 +117,7 @@ class DiscordBotListVotePayload(BaseVotePayload):
         --------
         :class:`str`
         """
-        return self.__data['username']
+        return self._data['username']
 
 
 class TopGGVotePayload(BaseVotePayload):
@@ -132,7 +132,7 @@ class TopGGVotePayload(BaseVotePayload):
     def __init__(self, client: ClientProtocol, data: dict):
         super().__init__(client, data)
 
-        self.__bot: Optional[Snowflake] = None
+        self._bot: Optional[Snowflake] = None
 
     @property
     def bot_id(self) -> int:
@@ -143,7 +143,7 @@ class TopGGVotePayload(BaseVotePayload):
         --------
         :class:`int`
         """
-        return self.__data['bot']
+        return int(self._data['bot'])
 
     @property
     def user_id(self) -> int:
@@ -154,7 +154,7 @@ class TopGGVotePayload(BaseVotePayload):
         --------
         :class:`int`
         """
-        return self.__data['user']
+        return int(self._data['user'])
 
     @property
     def type(self) -> Literal["upvote", "test"]:
@@ -165,7 +165,7 @@ class TopGGVotePayload(BaseVotePayload):
         --------
         Literal["upvote", "test"]
         """
-        return self.__data['type']
+        return self._data['type']
 
     @property
     def is_weekend(self) -> bool:
@@ -176,7 +176,7 @@ class TopGGVotePayload(BaseVotePayload):
         --------
         :class:`bool`
         """
-        return self.__data['isWeekend']
+        return self._data['isWeekend']
 
     @property
     def query(self) -> Optional[str]:
@@ -187,7 +187,7 @@ class TopGGVotePayload(BaseVotePayload):
         --------
         :class:`str`
         """
-        return self.__data.get('query')
+        return self._data.get('query')
 
     @property
     def bot(self) -> Optional[Snowflake]:
@@ -199,12 +199,12 @@ class TopGGVotePayload(BaseVotePayload):
         --------
         Optional[:class:`Snowflake`]
         """
-        return self.__bot or self.__client.get_user(self.bot_id)
+        return self._bot or self._client.get_user(self.bot_id)
 
     async def fetch(self) -> None:
         """
         Fetches the user id from the Discord API to ensure `TopGGVotePayload.user` and `TopGGVotePayload.bot`
         are not ``None``.
         """
-        self.__bot = await self.__client.fetch_user(self.bot_id)
+        self._bot = await self._client.fetch_user(self.bot_id)
         await super().fetch()
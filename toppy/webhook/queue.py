@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Literal, Optional
+
+if TYPE_CHECKING:
+    from .payload import BaseVotePayload
+
+
+__all__ = (
+    'VoteQueue',
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+class VoteQueue:
+    """
+    A bounded queue between the webhook handlers and the work done for each vote.
+
+    Handlers respond as soon as a vote is queued so a slow database never delays the response
+    and causes the site to retry. Votes are dispatched and inserted into the database by ``workers`` tasks.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    maxsize: :class:`int`
+        The maximum amount of votes waiting to be handled.
+        Defaults to 1000.
+    workers: :class:`int`
+        The amount of votes handled at once.
+        Defaults to 4.
+    backpressure: Literal['block', 'shed']
+        What to do with a vote when the queue is full. ``block`` makes the request wait for space
+        and ``shed`` responds with status ``503`` right away so the site tries again later.
+        Defaults to ``block``.
+
+    Attributes
+    -----------
+    max_depth: :class:`int`
+        The most votes that have been waiting at once.
+    enqueued: :class:`int`
+        The amount of votes queued.
+    shed: :class:`int`
+        The amount of votes rejected because the queue was full.
+    processed: :class:`int`
+        The amount of votes handled.
+    failed: :class:`int`
+        The amount of votes that raised an exception while being handled.
+    """
+    def __init__(self, maxsize: int = 1000, *, workers: int = 4, backpressure: Literal['block', 'shed'] = 'block'):
+        if backpressure not in ('block', 'shed'):
+            raise ValueError(f'backpressure must be block or shed, not {backpressure!r}')
+
+        self.maxsize = maxsize
+        self.workers = workers
+        self.backpressure = backpressure
+
+        self.max_depth: int = 0
+        self.enqueued: int = 0
+        self.shed: int = 0
+        self.processed: int = 0
+        self.failed: int = 0
+
+        self._queue: Optional[asyncio.Queue[tuple[str, BaseVotePayload]]] = None
+        self._tasks: list[asyncio.Task] = []
+
+    def __repr__(self) -> str:
+        return (
+            f'<{self.__class__.__name__} depth={self.depth} maxsize={self.maxsize} workers={self.workers} '
+            f'backpressure={self.backpressure!r}>'
+        )
+
+    @property
+    def depth(self) -> int:
+        """
+        The amount of votes waiting to be handled.
+
+        Returns
+        --------
+        :class:`int`
+        """
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the workers have been started.
+
+        Returns
+        --------
+        :class:`bool`
+        """
+        return bool(self._tasks)
+
+    def start(self, process: Callable[[str, BaseVotePayload], Awaitable[None]]) -> None:
+        """
+        Start the workers. This is done by the webhook server when it starts.
+
+        Parameters
+        -----------
+        process: Callable[[:class:`str`, :class:`BaseVotePayload`], Awaitable[None]]
+            Handles a vote with the name of its event.
+        """
+        # made here so the queue is bound to the running loop
+        self._queue = asyncio.Queue(self.maxsize)
+        self._tasks = [
+            asyncio.get_running_loop().create_task(self._worker(process), name=f'toppy_vote_worker_{number}')
+            for number in range(self.workers)
+        ]
+
+    async def stop(self, timeout: Optional[float] = 10) -> None:
+        """
+        Wait for the queued votes to be handled and stop the workers.
+
+        Parameters
+        -----------
+        timeout: Optional[:class:`float`]
+            The maximum amount of seconds to wait for the queue to be empty.
+            Defaults to 10.
+        """
+        if self._queue is not None and self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                _log.warning('Stopping with %d votes still queued.', self.depth)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def put(self, event: str, payload: BaseVotePayload, *, block: Optional[bool] = None) -> bool:
+        """
+        Queue a vote.
+
+        Parameters
+        -----------
+        event: :class:`str`
+            The name of the event to dispatch.
+        payload: :class:`BaseVotePayload`
+            The vote.
+        block: Optional[:class:`bool`]
+            Whether to wait for space when the queue is full. ``None`` to follow ``backpressure``.
+
+        Returns
+        --------
+        :class:`bool`
+            Whether the vote was queued. ``False`` if it was shed.
+        """
+        if self._queue is None:
+            raise RuntimeError('The queue has not been started.')
+
+        if block is None:
+            block = self.backpressure == 'block'
+
+        if not block:
+            try:
+                self._queue.put_nowait((event, payload))
+            except asyncio.QueueFull:
+                self.shed += 1
+                _log.warning('Shedding a %s because the queue is full.', event)
+                return False
+        else:
+            await self._queue.put((event, payload))
+
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    async def _worker(self, process: Callable[[str, BaseVotePayload], Awaitable[None]]) -> None:
+        queue = self._queue
+        assert queue is not None
+
+        while True:
+            event, payload = await queue.get()
+            try:
+                await process(event, payload)
+            except Exception:
+                self.failed += 1
+                _log.exception('Handling a %s failed.', event)
+            else:
+                self.processed += 1
+            finally:
+                queue.task_done()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Type, Union
+
+from aiohttp import web
+
+from .auth import _resolve_auth
+from .limits import WebhookLimits
+from .payload import BaseVotePayload, DiscordBotListVotePayload, TopGGVotePayload
+from ..utils import from_json
+
+if TYPE_CHECKING:
+    from .auth import WebhookAuth
+    from .cache import AbstractDatabase
+    from .dedup import VoteDeduplicator
+    from .queue import VoteQueue
+    from ..abc import ClientProtocol
+
+
+__all__ = ()
+
+
+_log = logging.getLogger(__name__)
+
+
+# site -> (event, payload class). The route of each site is ``/{site}``.
+_VOTE_ROUTES: dict[str, tuple[str, Type[BaseVotePayload]]] = {
+    'dbl': ('dbl_vote', DiscordBotListVotePayload),
+    'topgg': ('topgg_vote', TopGGVotePayload)
+}
+
+
+def _vote_processor(client: ClientProtocol,
+                    db: Optional[AbstractDatabase]) -> Callable[[str, BaseVotePayload], Awaitable[None]]:
+    async def process(event: str, payload: BaseVotePayload) -> None:
+        client.dispatch(event, payload)
+
+        if db:
+            await db.insert(payload)
+
+    return process
+
+
+async def _enqueue_vote(client: ClientProtocol, queue: VoteQueue, dedup: Optional[VoteDeduplicator],
+                        site: str, data: dict, body: bytes, *, block: Optional[bool] = None) -> int:
+    # returns the status to respond with
+    event, payload_class = _VOTE_ROUTES[site]
+    payload = payload_class(client, data)
+
+    key = None
+    if dedup is not None:
+        key = dedup.key(site, payload, body)
+        if not dedup.add(key):
+            _log.debug('Ignoring a duplicate %s.', event)
+            return 200
+
+    if not await queue.put(event, payload, block=block):
+        if key is not None:
+            dedup.discard(key)
+        return 503
+
+    return 200
+
+
+def _add_vote_routes(app: web.Application, client: ClientProtocol, auths: dict[str, Any], *,
+                     queue: VoteQueue, process: Callable[[str, BaseVotePayload], Awaitable[None]],
+                     dedup: Optional[VoteDeduplicator] = None,
+                     limits: Union[None, WebhookLimits, dict[str, WebhookLimits]] = None) -> None:
+    def vote_handler(site: str, auth: Optional[WebhookAuth], limits: WebhookLimits):
+        async def handler(request: web.Request) -> web.Response:
+            # checked before the body is read so unauthorized requests are cheap to reject
+            if auth is not None and not auth.check(request.headers.get('Authorization')):
+                return limits.reject('unauthorized', 401)
+
+            body = await limits.read(request)
+            if isinstance(body, web.Response):
+                return body
+
+            try:
+                data = from_json(body)
+            except ValueError:
+                return limits.reject('invalid_body', 400)
+            if not isinstance(data, dict):
+                return limits.reject('invalid_body', 400)
+
+            status = await _enqueue_vote(client, queue, dedup, site, data, body)
+            if status == 503:
+                limits.rejected['queue_full'] += 1
+                return web.Response(status=503, headers={'Retry-After': '1'})
+
+            return web.Response(status=200, body=__package__)
+
+        return handler
+
+    async def start_queue(app: web.Application) -> None:
+        if dedup is not None:
+            dedup.load()
+        queue.start(process)
+
+    async def stop_queue(app: web.Application) -> None:
+        await queue.stop()
+        if dedup is not None:
+            dedup.save()
+
+    if limits is None:
+        limits = WebhookLimits()
+
+    for site in _VOTE_ROUTES:
+        if isinstance(limits, dict):
+            route_limits = limits.get(site) or WebhookLimits()
+        else:
+            route_limits = limits
+        app.router.add_post(f'/{site}', vote_handler(site, _resolve_auth(auths[site]), route_limits))
+
+    app.on_startup.append(start_queue)
+    app.on_cleanup.append(stop_queue)
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from aiohttp import web
+
+from .auth import WebhookAuth, _resolve_auth
+from .limits import WebhookLimits
+from .queue import VoteQueue
+from .routes import _VOTE_ROUTES, _add_vote_routes, _enqueue_vote, _vote_processor
+from ..utils import from_json, to_json, MISSING
+
+if TYPE_CHECKING:
+    from .cache import AbstractDatabase
+    from .dedup import VoteDeduplicator
+    from .payload import BaseVotePayload
+    from ..abc import ClientProtocol
+
+
+__all__ = (
+    'WebhookWorkers',
+)
+
+
+_log = logging.getLogger(__name__)
+
+
+_CONFIG_ENV = 'TOPPY_WEBHOOK_WORKER'
+_SITES = {event: site for site, (event, _) in _VOTE_ROUTES.items()}
+# seconds, a process that exits is started again after 1, 2, 4... up to _MAX_RESTART_DELAY
+_MAX_RESTART_DELAY = 60
+_RESTART_RESET = 60
+
+
+class WebhookWorkers:
+    """
+    Runs the webhook server in separate processes that share the port so a spike of votes doesn't slow down the bot.
+
+    Each process receives votes, checks the authorization and forwards the vote to the bot's process over a
+    Unix socket. The bot's process ignores duplicates, queues the votes and dispatches them like
+    :func:`create_webhook_server`. Processes that exit while running are logged and started again, waiting longer
+    each time one keeps exiting. The processes run in their own session so a Ctrl+C only reaches the bot and
+    they are stopped by :meth:`stop`.
+
+    This only works on systems with ``SO_REUSEPORT`` and Unix sockets such as Linux and macOS.
+
+    .. versionadded:: 2.1
+
+    Parameters
+    -----------
+    client: :class:`ClientProtocol`
+        The Discord Bot instance.
+    workers: :class:`int`
+        The amount of processes to run.
+        Defaults to 2.
+    host: :class:`str`
+        The host to listen on.
+        Defaults to ``0.0.0.0``.
+    port: :class:`int`
+        The port to listen on.
+        Defaults to 8080.
+    dbl_auth: Union[None, :class:`str`, Iterable[:class:`str`], :class:`WebhookAuth`]
+        The Discord Bot List webhook secrets. The secrets of a :class:`WebhookAuth` are sent to the processes
+        when they start so changing them later requires a restart.
+    topgg_auth: Union[None, :class:`str`, Iterable[:class:`str`], :class:`WebhookAuth`]
+        The Top.gg webhook secrets.
+    db: Optional[:class:`AbstractDatabase`]
+        The instance of a database. It is used from the bot's process.
+    queue: Optional[:class:`VoteQueue`]
+        The queue votes wait in in the bot's process. A process has already responded to a vote when it forwards
+        it, so forwarded votes always wait for space even if ``backpressure`` is ``shed``. While the queue is full
+        the processes stop forwarding and respond with status ``503`` once their own queue of
+        ``worker_queue_size`` votes is full, so the site sends the vote again later.
+    dedup: Optional[:class:`VoteDeduplicator`]
+        Used from the bot's process so duplicates received by different processes are found.
+    limits: Union[None, :class:`WebhookLimits`, dict[:class:`str`, :class:`WebhookLimits`]]
+        The limits of the routes in each process. Rejected requests are counted in the processes, not in
+        :attr:`WebhookLimits.rejected`.
+    worker_queue_size: :class:`int`
+        The maximum amount of votes waiting to be forwarded in each process.
+        Defaults to 1000.
+    socket_path: Optional[:class:`str`]
+        The path of the Unix socket. Defaults to a file in the temporary directory.
+
+    Attributes
+    -----------
+    forwarded: :class:`int`
+        The amount of votes received from the processes.
+    restarts: :class:`int`
+        The amount of times a process was started again after exiting.
+
+    Example
+    ----------
+    .. code:: py
+
+        workers = toppy.webhook.WebhookWorkers(bot, workers=4, port=8080, topgg_auth='...')
+
+        async def setup_hook():
+            await workers.start()
+    """
+    def __init__(
+            self,
+            client: ClientProtocol,
+            *,
+            workers: int = 2,
+            host: str = '0.0.0.0',
+            port: int = 8080,
+            dbl_auth: Union[None, str, Iterable[str], WebhookAuth] = MISSING,
+            topgg_auth: Union[None, str, Iterable[str], WebhookAuth] = MISSING,
+            db: Optional[AbstractDatabase] = None,
+            queue: Optional[VoteQueue] = None,
+            dedup: Optional[VoteDeduplicator] = None,
+            limits: Union[None, WebhookLimits, dict[str, WebhookLimits]] = None,
+            worker_queue_size: int = 1000,
+            socket_path: Optional[str] = None
+    ):
+        if dbl_auth is MISSING:
+            dbl_auth = os.urandom(16).hex()
+        if topgg_auth is MISSING:
+            topgg_auth = os.urandom(16).hex()
+
+        self.client = client
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.db = db
+        self.queue: VoteQueue = queue or VoteQueue()
+        self.dedup = dedup
+        self.limits = limits
+        self.worker_queue_size = worker_queue_size
+        self.socket_path: str = socket_path or os.path.join(tempfile.gettempdir(), f'toppy-{os.getpid()}.sock')
+
+        self.forwarded: int = 0
+        self.restarts: int = 0
+
+        self._auths: dict[str, Optional[WebhookAuth]] = {
+            'dbl': _resolve_auth(dbl_auth),
+            'topgg': _resolve_auth(topgg_auth)
+        }
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._processes: list[asyncio.subprocess.Process] = []
+        self._monitors: list[asyncio.Task] = []
+        self._env: dict[str, str] = {}
+        self._stopping: bool = False
+        self._ready: int = 0
+        self._all_ready: Optional[asyncio.Event] = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} workers={self.workers} host={self.host!r} port={self.port}>'
+
+    async def __aenter__(self) -> WebhookWorkers:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    @property
+    def pids(self) -> list[int]:
+        """
+        The process IDs of the running processes.
+
+        Returns
+        --------
+        list[:class:`int`]
+        """
+        return [process.pid for process in self._processes if process.returncode is None]
+
+    async def start(self, timeout: float = 30) -> None:
+        """
+        Start listening for forwarded votes and start the processes.
+        Returns once every process is receiving votes.
+
+        Parameters
+        -----------
+        timeout: :class:`float`
+            The amount of seconds to wait for the processes to start.
+            Defaults to 30.
+
+        Raises
+        -------
+        RuntimeError
+            A process stopped or didn't start in time. Every process is stopped.
+        """
+        self._ready = 0
+        self._all_ready = asyncio.Event()
+        self._stopping = False
+
+        if self.dedup is not None:
+            self.dedup.load()
+        self.queue.start(_vote_processor(self.client, self.db))
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_connection, self.socket_path, limit=2 ** 20)
+
+        config = {
+            'socket_path': self.socket_path,
+            'host': self.host,
+            'port': self.port,
+            'auths': {site: auth.secrets if auth is not None else None for site, auth in self._auths.items()},
+            'limits': self._limits_config(),
+            'queue_size': self.worker_queue_size
+        }
+        # the config is passed in the environment so the secrets aren't visible in the arguments
+        # and the path is passed so toppy imports the same way when the bot added it to sys.path itself
+        self._env = dict(
+            os.environ,
+            **{_CONFIG_ENV: to_json(config), 'PYTHONPATH': os.pathsep.join(os.path.abspath(path) for path in sys.path)}
+        )
+
+        for _ in range(self.workers):
+            self._processes.append(await self._spawn())
+
+        loop = asyncio.get_running_loop()
+        ready = loop.create_task(self._all_ready.wait())
+        exits = [loop.create_task(process.wait()) for process in self._processes]
+        await asyncio.wait([ready, *exits], timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        for task in (ready, *exits):
+            task.cancel()
+
+        if not self._all_ready.is_set():
+            await self.stop()
+            raise RuntimeError(f'{self.workers - self._ready} webhook processes failed to start.')
+
+        self._monitors = [loop.create_task(self._monitor(process)) for process in self._processes]
+        _log.info('Started %d webhook processes on %s:%d.', self.workers, self.host, self.port)
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        # a new session keeps signals sent to the bot's process group away from the processes
+        return await asyncio.create_subprocess_exec(
+            sys.executable, '-c', 'from toppy.webhook.workers import _run_worker; _run_worker()', env=self._env,
+            start_new_session=True
+        )
+
+    async def _monitor(self, process: asyncio.subprocess.Process) -> None:
+        failures = 0
+        while True:
+            started = time.monotonic()
+            returncode = await process.wait()
+            if self._stopping:
+                return
+
+            # a process that ran for a while crashed once, one that keeps exiting waits longer each time
+            if time.monotonic() - started >= _RESTART_RESET:
+                failures = 0
+            delay = min(2 ** failures, _MAX_RESTART_DELAY)
+            failures += 1
+
+            _log.warning(
+                'Webhook process %d exited with code %d, starting it again in %d seconds.',
+                process.pid, returncode, delay
+            )
+            await asyncio.sleep(delay)
+            if self._stopping:
+                return
+
+            self._processes.remove(process)
+            process = await self._spawn()
+            self._processes.append(process)
+            self.restarts += 1
+
+    def _limits_config(self) -> dict[str, dict]:
+        limits = {}
+        for site in _VOTE_ROUTES:
+            if isinstance(self.limits, dict):
+                route_limits = self.limits.get(site) or WebhookLimits()
+            else:
+                route_limits = self.limits or WebhookLimits()
+
+            limits[site] = {
+                'max_body_size': route_limits.max_body_size,
+                'read_timeout': route_limits.read_timeout,
+                'content_types': list(route_limits.content_types) if route_limits.content_types is not None else None
+            }
+        return limits
+
+    async def stop(self, timeout: float = 10) -> None:
+        """
+        Stop the processes after they forward the votes they received and stop handling votes.
+
+        Parameters
+        -----------
+        timeout: :class:`float`
+            The amount of seconds to wait for each process to stop before it is killed.
+            Defaults to 10.
+        """
+        self._stopping = True
+        for task in self._monitors:
+            task.cancel()
+        await asyncio.gather(*self._monitors, return_exceptions=True)
+        self._monitors = []
+
+        for process in self._processes:
+            if process.returncode is None:
+                process.terminate()
+
+        for process in self._processes:
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                _log.warning('Killing webhook process %d because it did not stop in time.', process.pid)
+                process.kill()
+                await process.wait()
+        self._processes = []
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        await self.queue.stop()
+        if self.dedup is not None:
+            self.dedup.save()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            async for line in reader:
+                if line == b'\n':
+                    # sent once the process is listening
+                    self._ready += 1
+                    if self._ready >= self.workers and self._all_ready is not None:
+                        self._all_ready.set()
+                    continue
+
+                message = from_json(line)
+                data = message['data']
+                self.forwarded += 1
+                # the process already responded so the vote can't be shed, reading stops until there is space
+                await _enqueue_vote(
+                    self.client, self.queue, self.dedup, _SITES[message['event']], data, to_json(data).encode(),
+                    block=True
+                )
+        except (ConnectionError, ValueError, KeyError) as exc:
+            _log.warning(f'A webhook process disconnected with an exception {exc.__class__.__name__!r}.')
+        finally:
+            writer.close()
+
+
+async def _serve_worker(config: dict) -> None:
+    reader, writer = await asyncio.open_unix_connection(config['socket_path'])
+
+    async def forward(event: str, payload: BaseVotePayload) -> None:
+        writer.write(to_json({'event': event, 'data': payload.raw}).encode() + b'\n')
+        await writer.drain()
+
+    app = web.Application()
+    # one task forwards so votes arrive in order, the client is only needed in the bot's process
+    queue = VoteQueue(config['queue_size'], workers=1, backpressure='shed')
+    limits = {
+        site: WebhookLimits(
+            options['max_body_size'],
+            read_timeout=options['read_timeout'],
+            content_types=options['content_types']
+        )
+        for site, options in config['limits'].items()
+    }
+    _add_vote_routes(app, None, config['auths'], queue=queue, process=forward, limits=limits)  # type: ignore
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, config['host'], config['port'], reuse_port=True)
+    await site.start()
+
+    writer.write(b'\n')
+    await writer.drain()
+
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopped.set)
+
+    async def watch_bot() -> None:
+        # the bot never writes so this only returns once its process closes the socket
+        await reader.read()
+        stopped.set()
+
+    watcher = loop.create_task(watch_bot())
+    try:
+        await stopped.wait()
+    finally:
+        watcher.cancel()
+        await runner.cleanup()
+        writer.close()
+
+
+def _run_worker() -> None:
+    config = from_json(os.environ[_CONFIG_ENV])
+    asyncio.run(_serve_worker(config))